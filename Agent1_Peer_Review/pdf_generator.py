@@ -12,6 +12,8 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 import os
+import sys
+from src.utils.result_store import get_result_store
 
 class PDFReportGenerator:
     def __init__(self, executive_summary, quality_control, output_path):
@@ -371,8 +373,8 @@ class PDFReportGenerator:
                 # Add code prefix to section header
                 section_title = f"{section_id} - {section_data['section_name']}"
                 elements.append(Paragraph(section_title, self.styles['SectionHeader']))
-                # Add summary
-                elements.append(Paragraph(section_data['summary'], self.styles['Justified']))
+                # Add summary (not applicable sections only carry a message)
+                elements.append(Paragraph(section_data.get('summary', section_data.get('message', '')), self.styles['Justified']))
                 elements.append(Spacer(1, 0.2*inch))
                 # Add suggestions
                 if 'suggestions' in section_data and section_data['suggestions']:
@@ -445,23 +447,24 @@ class PDFReportGenerator:
                  onLaterPages=lambda c, d: (self.create_header(c, d), self.create_footer(c, d)))
 
 def generate_pdf(inputs):      
+    # Results not passed in are read from the result store
+    executive_summary_results = inputs.get('executive_summary_results')
+    quality_control_results = inputs.get('quality_control_results')
+    if executive_summary_results is None or quality_control_results is None:
+        store = get_result_store()
+        executive_summary_results = executive_summary_results or store.get_result(inputs['run_id'], 'executive_summary')
+        quality_control_results = quality_control_results or store.get_result(inputs['run_id'], 'quality_control')
+    
     # Generate PDF
-    generator = PDFReportGenerator(inputs['executive_summary_results'], inputs['quality_control_results'], inputs['output_path'])
+    generator = PDFReportGenerator(executive_summary_results, quality_control_results, inputs['output_path'])
     generator.generate_pdf()
     print(f"PDF report generated successfully at: {inputs['output_path']}")
 
 if __name__ == "__main__":
     base_dir = os.path.dirname(os.path.abspath(__file__))
     
-    with open(os.path.join(base_dir, 'results', 'executive_summary.json'), "r") as f:
-        executive_summary = json.load(f)
-        
-    with open(os.path.join(base_dir, 'results', 'quality_control_results.json'), "r") as f:
-        quality_control_results = json.load(f)    
-    
     inputs = {
-        'executive_summary_results': executive_summary,
-        'quality_control_results': quality_control_results,
+        'run_id': sys.argv[1] if len(sys.argv) > 1 else get_result_store().latest_run_id(),
         'output_path': os.path.join(base_dir, 'reports', 'review_report.pdf')
     }
             
@@ -1,10 +1,10 @@
 import os
 import json
-import glob
-from src.utils.pdf_parser import PDFParser
+from src.utils.manuscript import Manuscript, get_manuscript
+from src.utils.result_store import get_result_store, get_run_id, is_failed_result
 from src.reviewer_agents.controller_agent import ControllerAgent
-from src.core.config import DEFAULT_MODEL
-from src.utils.combine_results import combine_results_by_category
+from src.core.config import DEFAULT_MODEL, WRITE_AGENT_RESULT_FILES
+from src.utils.combine_results import AGENT_CATEGORIES, categorize_results, save_run_bundle
 from dotenv import load_dotenv
 import pathlib
 
@@ -16,62 +16,67 @@ load_dotenv(env_path)
 def process_pdf(pdf_url):
     """Process PDF and extract text, figures, and tables."""   
 
-    # Pass to PDFParser  
-    parser = PDFParser(pdf_url)
-    
-    # Extract all components
-    text = parser.extract_text()
-    metadata = parser.get_metadata()
-    images = parser.extract_images()
-    tables = parser.extract_tables()
-    
-    return {
-        'text': text,
-        'metadata': metadata,
-        'images': images,
-        'tables': tables
-    }
+    # Parse the PDF once; quality control and the executive summary reuse the result
+    return Manuscript.from_pdf(pdf_url)
 
-def run_analysis(manuscript):    # Find PDF in manuscripts directory   
+def run_analysis(manuscript, write_agent_files=WRITE_AGENT_RESULT_FILES, category=None, executor=None):    # Find PDF in manuscripts directory   
     
     # Process the manuscript
-    manuscript_data = process_pdf(manuscript['manuscript_src'])   
+    manuscript_data = get_manuscript(manuscript)
+    
+    # Register the run in the result store
+    store = get_result_store()
+    run_id = get_run_id(manuscript | {'manuscript_data': manuscript_data})
     
     # Initialize controller agent
     controller = ControllerAgent(model=DEFAULT_MODEL)
     
-    # Run the analysis
-    results = controller.run_analysis(text=manuscript_data['text'])
-    
-    # Save results
-    output_dir = "results"
-    os.makedirs(output_dir, exist_ok=True)
+    # Run all agents, or only those of one category (e.g. 'rigor_results') so its quality control can start early
+    agent_ids = [
+        agent_id for agent_id in controller.agents
+        if category is None or AGENT_CATEGORIES[agent_id[:1]] == category
+    ]
     
-    # Save manuscript data for reference
-    manuscript_data_file = os.path.join(output_dir, "manuscript_data.json")
-    with open(manuscript_data_file, "w") as f:
-        # Convert image data to base64 for JSON serialization
-        manuscript_json = manuscript_data.copy()
-        for img in manuscript_json['images']:
-            img['image_data'] = None  # Remove binary image data for JSON
-        json.dump(manuscript_json, f, indent=2)
+    # Agents that completed in an earlier attempt of this run are not run again
+    stored = store.get_agent_results(run_id)
+    completed = {
+        agent_id: stored[agent_id] for agent_id in agent_ids
+        if agent_id in stored and not is_failed_result(stored[agent_id])
+    }
+    if completed:
+        print(f"Resuming run {run_id}: {len(completed)} of {len(agent_ids)} agents already completed")
     
-    # Save individual agent results
-    for agent_name, result in results.items():
-        output_file = os.path.join(output_dir, f"{agent_name}_results.json")
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+    # Run the analysis, saving the results of each agent as soon as it finishes
+    with store.timed(run_id, f'analysis_{category}' if category else 'analysis'):
+        results = controller.run_analysis(
+            text=manuscript_data.text,
+            sections=manuscript_data.section_texts,
+            completed=completed,
+            on_results=lambda unit_results: store.save_agent_results(run_id, unit_results),
+            agent_ids=agent_ids,
+            executor=executor
+        )
     
-    # Save combined results
-    combined_output = os.path.join(output_dir, "combined_results.json")
-    with open(combined_output, "w") as f:
-        json.dump(results, f, indent=2)
+    # Export the agent results to files only on request
+    if write_agent_files:
+        export_agent_results(manuscript | {'manuscript_data': manuscript_data, 'run_id': run_id})
     
-    # Combine results into category-specific files
-    combined_results = combine_results_by_category(output_dir, output_dir)
+    # Categorize the results in memory for quality control
+    combined_results = categorize_results(results)
+    if category is not None:
+        combined_results = {category: combined_results[category]}
+    combined_results['manuscript_data'] = manuscript_data
+    combined_results['run_id'] = run_id
+    combined_results['agents_run'] = [agent_id for agent_id in results if agent_id not in completed]
 
     return combined_results
 
+def export_agent_results(inputs):
+    """Export the stored agent results of a run to results/<run_id>."""
+    run_id = get_run_id(inputs)
+    results = get_result_store().get_agent_results(run_id)
+    return save_run_bundle(get_manuscript(inputs).to_dict(), results, os.path.join("results", run_id), write_agent_files=True)
+
 if __name__ == "__main__":   
     
     with open('manuscript.json', "r") as f:
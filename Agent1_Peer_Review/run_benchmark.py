@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the full review pipeline on synthetic manuscripts.
+
+Generates manuscripts of the requested page counts and runs PDF parsing,
+prompt building, the reviewer agents, quality control, the executive summary
+(one after another, or as a stage graph with --stage-graph) and the report
+generation against the mock language model backend, then writes
+the per-stage wall time, CPU time and peak memory as JSON.
+
+Example:
+    python run_benchmark.py --pages 5 50 300 --latency 0.5 --output benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the review pipeline on synthetic manuscripts')
+    parser.add_argument('--pages', type=int, nargs='+', default=[5, 50, 300], help='Page counts of the manuscripts')
+    parser.add_argument('--latency', type=float, default=0.5, help='Mean mock LLM latency in seconds')
+    parser.add_argument('--latency-stddev', type=float, default=0.1, help='Standard deviation of the mock LLM latency')
+    parser.add_argument('--latency-distribution', type=str, default='normal',
+                        choices=['constant', 'uniform', 'normal', 'lognormal'], help='Mock LLM latency distribution')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the manuscripts and the mock latencies')
+    parser.add_argument('--stage-graph', action='store_true',
+                        help='Run agents, quality control and the executive summary as one stage graph')
+    parser.add_argument('--workdir', type=str, default=None, help='Directory for manuscripts, results and reports')
+    parser.add_argument('--output', '-o', type=str, default='benchmark_results.json', help='Path of the JSON report')
+    return parser.parse_args()
+
+
+def main():
+    """Main function to run the script."""
+    args = parse_args()
+    output_path = os.path.abspath(args.output)
+    
+    # The pipeline reads its configuration at import time, so configure it first
+    os.environ['LLM_BACKEND'] = 'mock'
+    os.environ['LLM_CACHE_ENABLED'] = 'false'
+    os.environ['PDF_CACHE_ENABLED'] = 'false'
+    os.environ['LLM_MOCK_LATENCY_MEAN'] = str(args.latency)
+    os.environ['LLM_MOCK_LATENCY_STDDEV'] = str(args.latency_stddev)
+    os.environ['LLM_MOCK_LATENCY_DISTRIBUTION'] = args.latency_distribution
+    os.environ['LLM_MOCK_SEED'] = str(args.seed)
+    # The mock has no provider quota; set these explicitly to benchmark throttling
+    os.environ.setdefault('LLM_REQUESTS_PER_MINUTE', '1000000')
+    os.environ.setdefault('LLM_TOKENS_PER_MINUTE', '1000000000')
+    
+    # The pipeline writes results/ and reports/ relative to the working directory
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix='rigorous_benchmark_'))
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    sys.path.insert(0, BASE_DIR)
+    
+    import pdf_generator
+    import run_analysis
+    import run_executive_summary
+    import run_quality_control
+    from src.core.config import DEFAULT_MODEL, MAX_CONCURRENT_AGENTS
+    from src.core.prompt_layout import build_messages
+    from src.core.usage import usage_tracker
+    from src.reviewer_agents.controller_agent import ControllerAgent
+    from src.utils.benchmark import StageRecorder
+    from src.utils.combine_results import categorize_results
+    from src.utils.result_store import get_result_store, get_run_id
+    from src.utils.synthetic_manuscript import generate_manuscript_pdf
+    from run_local_aipeer_review import get_local_manuscript, run_review
+    
+    runs = []
+    for pages in args.pages:
+        print(f"\nBenchmarking a {pages}-page manuscript...")
+        manuscript_path = os.path.join(workdir, 'manuscripts', f'synthetic_{pages}p.pdf')
+        os.makedirs(os.path.dirname(manuscript_path), exist_ok=True)
+        generate_manuscript_pdf(manuscript_path, pages, seed=args.seed)
+        
+        with open('manuscript.json', 'w') as f:
+            json.dump({
+                'manuscript_src': manuscript_path,
+                'publicationOutlets': 'Synthetic Journal',
+                'reviewFocus': 'Statistics and Writing'
+            }, f)
+        manuscript = get_local_manuscript()
+        
+        usage_tracker.reset()
+        recorder = StageRecorder()
+        try:
+            with recorder.stage('pdf_parsing'):
+                manuscript_data = run_analysis.process_pdf(manuscript['manuscript_src'])
+                manuscript['manuscript_data'] = manuscript_data
+            
+            with recorder.stage('prompt_building'):
+                # Section selection and prompt assembly as done by the controller, without the calls
+                controller = ControllerAgent(model=DEFAULT_MODEL)
+                sections = manuscript_data.section_texts
+                for agent_id, agent in controller.agents.items():
+                    agent_text = controller._select_unit_text([agent_id], sections, manuscript_data.text)
+                    build_messages(agent.build_prompt('empirical'), document=agent_text)
+            
+            if args.stage_graph:
+                with recorder.stage('review_graph'):
+                    manuscript = run_review(manuscript)
+            else:
+                with recorder.stage('agents'):
+                    results = controller.run_analysis(text=manuscript_data.text, sections=manuscript_data.section_texts)
+                    get_result_store().save_agent_results(get_run_id(manuscript), results)
+                    manuscript = manuscript | categorize_results(results)
+                
+                with recorder.stage('quality_control'):
+                    manuscript['quality_control_results'] = run_quality_control.run_quality_control(manuscript)
+                
+                with recorder.stage('executive_summary'):
+                    manuscript['executive_summary_results'] = run_executive_summary.run_executive_summary(manuscript)
+            
+            with recorder.stage('pdf_generation'):
+                manuscript['output_path'] = os.path.join(workdir, 'reports', f'synthetic_{pages}p_review_report.pdf')
+                os.makedirs(os.path.dirname(manuscript['output_path']), exist_ok=True)
+                pdf_generator.generate_pdf(manuscript)
+        finally:
+            recorder.close()
+        
+        get_result_store().finish_run(manuscript['run_id'], usage=usage_tracker.summary())
+        runs.append(recorder.report({
+            'run_id': manuscript['run_id'],
+            'pages': pages,
+            'manuscript_bytes': os.path.getsize(manuscript_path),
+            'text_characters': len(manuscript_data.text),
+            'llm_usage': usage_tracker.summary()
+        }))
+    
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'model': DEFAULT_MODEL,
+        'max_concurrent_agents': MAX_CONCURRENT_AGENTS,
+        'stage_graph': args.stage_graph,
+        'mock_latency': {
+            'mean': args.latency,
+            'stddev': args.latency_stddev,
+            'distribution': args.latency_distribution
+        },
+        'runs': runs
+    }
+    
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    print(f"\nBenchmark results saved to: {output_path}")
+    for run in runs:
+        print(f"\n{run['pages']} pages:")
+        for stage in run['stages']:
+            print(f"  {stage['stage']:<18} wall {stage['wall_seconds']:8.2f}s  cpu {stage['cpu_seconds']:8.2f}s  "
+                  f"peak rss {stage['peak_rss_mb']:8.1f} MB  llm calls {stage['llm_calls']:3d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,11 @@ Script to run the Executive Summary Agent and generate a high-level summary of t
 """
 
 import os
+import sys
 import json
 from src.reviewer_agents.executive_summary_agent import ExecutiveSummaryAgent
+from src.utils.manuscript import get_manuscript
+from src.utils.result_store import get_result_store, get_run_id
 
 def get_local_manuscript():
     with open('manuscript.json', "r") as f:
@@ -35,17 +38,25 @@ def run_executive_summary(inputs):
     # Initialize the Executive Summary Agent
     agent = ExecutiveSummaryAgent()   
     
-    # Define output path
-    output_path = 'results/executive_summary.json'
+    # Quality control results not passed in are read from the result store
+    store = get_result_store()
+    run_id = get_run_id(inputs)
+    if 'quality_control_results' not in inputs:
+        inputs = inputs | {'quality_control_results': store.get_result(run_id, 'quality_control')}
+    
+    # An independent review generated ahead of quality control is reused
+    if inputs.get('independent_review') is None:
+        inputs = inputs | {'independent_review': store.get_result(run_id, 'independent_review')}
     
     try:
         # Process the inputs and generate the executive summary
-        results = agent.process(inputs)
+        with store.timed(run_id, 'executive_summary'):
+            results = agent.process(inputs)
         
         # Save the results
-        agent.save_results(results, output_path)
+        store.save_result(run_id, 'executive_summary', results)
         
-        print("\nExecutive Summary Generation Complete!", f"Results saved to: {output_path}")
+        print("\nExecutive Summary Generation Complete!", f"Results saved to run: {run_id}")
         
         # Print the scores
         print("\nOverall Scores:")
@@ -60,13 +71,28 @@ def run_executive_summary(inputs):
         print(f"Error generating executive summary: {str(e)}")
         raise
 
+def run_independent_review(inputs):
+    """Generate the independent review of the executive summary.
+    
+    The review reads only the manuscript, not the agent results, so it can run
+    while the agents and quality control are still running.
+    """
+    agent = ExecutiveSummaryAgent()
+    
+    store = get_result_store()
+    run_id = get_run_id(inputs)
+    with store.timed(run_id, 'independent_review'):
+        review = agent.generate_independent_review(get_manuscript(inputs).text, inputs['context'])
+    
+    # Save the review for the executive summary
+    store.save_result(run_id, 'independent_review', review)
+    
+    return review
+
 if __name__ == "__main__": 
     
     manuscript = get_local_manuscript()
     
-    with open('./results/quality_control_results.json', "r") as f:
-        quality_control_results_json = json.load(f)
-        
-    manuscript['quality_control_results'] = quality_control_results_json  
+    manuscript['run_id'] = sys.argv[1] if len(sys.argv) > 1 else get_result_store().latest_run_id()
     
     run_executive_summary(manuscript) 
\ No newline at end of file
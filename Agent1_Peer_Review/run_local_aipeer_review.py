@@ -1,11 +1,19 @@
+import argparse
 import run_analysis
 import run_quality_control
 import run_executive_summary
 import json
 import os
-from datetime import datetime
 import pdf_generator
 import time
+from concurrent.futures import ThreadPoolExecutor
+from src.core.config import MAX_CONCURRENT_AGENTS, WRITE_AGENT_RESULT_FILES
+from src.core.response_cache import get_response_cache
+from src.core.usage import usage_tracker
+from src.utils.manuscript import get_manuscript
+from src.utils.combine_results import AGENT_CATEGORIES
+from src.utils.result_store import get_result_store, get_run_id, is_failed_result
+from src.utils.stage_scheduler import StageScheduler
 
 
 
@@ -35,34 +43,168 @@ def get_local_manuscript():
         
     return manuscript
 
+def resume_run(manuscript, run_id):
+    """Point the manuscript at an earlier run, checking that its PDF has not changed."""
+    store = get_result_store()
+    run = store.get_run(run_id)
+    if run is None:
+        raise Exception(f"Run not found: {run_id}")
+    
+    manuscript['run_id'] = run_id
+    manuscript['manuscript_src'] = run['source']
+    manuscript['manuscript_data'] = get_manuscript(manuscript)
+    if manuscript['manuscript_data'].content_hash != run['manuscript_hash']:
+        raise Exception(f"The manuscript of run {run_id} has changed since the run started: {run['source']}")
+    
+    # Token usage of the run covers all of its attempts
+    if run['usage']:
+        usage_tracker.add_summary(run['usage'])
+    print(f"Resuming run {run_id} (status: {run['status']})")
+    return manuscript
+
+
+def run_review(manuscript):
+    """Run the analysis, quality control and executive summary stages as a dependency graph.
+    
+    Each category's quality control starts as soon as its own agents finish, and the
+    independent review of the executive summary starts right away, as it only reads
+    the manuscript. On a resumed run, a stage is reused if its stored result is valid
+    and none of the stages it depends on had to run again.
+    
+    Args:
+        manuscript (dict): Pipeline inputs with a run ID
+    
+    Returns:
+        dict: The inputs with the agent, quality control and executive summary results
+    """
+    store = get_result_store()
+    run_id = get_run_id(manuscript)
+    manuscript = manuscript | {'manuscript_data': get_manuscript(manuscript)}
+    
+    # Stages that ran in this attempt rather than reusing a stored result
+    rerun = set()
+    
+    def reuse(stage, stored, depends_on=()):
+        if is_failed_result(stored) or any(dependency in rerun for dependency in depends_on):
+            rerun.add(stage)
+            return False
+        print(f"Reusing the {stage.replace('_', ' ')} of run {run_id}")
+        return True
+    
+    def analysis(category):
+        def stage(results):
+            analysis_results = run_analysis.run_analysis(
+                manuscript, write_agent_files=False, category=category, executor=agent_pool
+            )
+            if analysis_results['agents_run']:
+                rerun.add(f'analysis_{category}')
+            return analysis_results
+        return stage
+    
+    def quality_control_category(category):
+        def stage(results):
+            stored = store.get_results(run_id, 'quality_control_category').get(category)
+            if reuse(f'quality_control_{category}', stored, [f'analysis_{category}']):
+                return stored
+            return run_quality_control.run_quality_control_category(
+                manuscript | results[f'analysis_{category}'], category
+            )
+        return stage
+    
+    def quality_control(results):
+        stored = store.get_result(run_id, 'quality_control')
+        categories = [f'quality_control_{category}' for category in AGENT_CATEGORIES.values()]
+        if reuse('quality_control', stored, categories):
+            return stored
+        return run_quality_control.assemble_quality_control(manuscript, {
+            category: results[f'quality_control_{category}'] for category in AGENT_CATEGORIES.values()
+        })
+    
+    def independent_review(results):
+        stored = store.get_result(run_id, 'independent_review')
+        if reuse('independent_review', stored):
+            return stored
+        return run_executive_summary.run_independent_review(manuscript)
+    
+    def executive_summary(results):
+        stored = store.get_result(run_id, 'executive_summary')
+        if reuse('executive_summary', stored, ['quality_control', 'independent_review']):
+            return stored
+        return run_executive_summary.run_executive_summary(manuscript | {
+            'quality_control_results': results['quality_control'],
+            'independent_review': results['independent_review']
+        })
+    
+    scheduler = StageScheduler()
+    for category in AGENT_CATEGORIES.values():
+        scheduler.add(f'analysis_{category}', analysis(category))
+        scheduler.add(f'quality_control_{category}', quality_control_category(category), [f'analysis_{category}'])
+    scheduler.add('quality_control', quality_control, [f'quality_control_{category}' for category in AGENT_CATEGORIES.values()])
+    scheduler.add('independent_review', independent_review)
+    scheduler.add('executive_summary', executive_summary, ['quality_control', 'independent_review'])
+    if WRITE_AGENT_RESULT_FILES:
+        scheduler.add('export', lambda results: run_analysis.export_agent_results(manuscript),
+                      [f'analysis_{category}' for category in AGENT_CATEGORIES.values()])
+    
+    # The agents of all categories share one pool, so their calls stay bounded together
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_AGENTS) as agent_pool:
+        with store.timed(run_id, 'review'):
+            results = scheduler.run()
+    
+    print("\nStage timeline (seconds):")
+    for stage, (start, end) in sorted(scheduler.timings.items(), key=lambda item: item[1]):
+        print(f"  {stage:<40} {start:8.2f} - {end:8.2f}")
+    
+    for category in AGENT_CATEGORIES.values():
+        manuscript[category] = results[f'analysis_{category}'][category]
+    manuscript['quality_control_results'] = results['quality_control']
+    manuscript['executive_summary_results'] = results['executive_summary']
+    return manuscript
+
+
 if __name__ == "__main__":
     
+    parser = argparse.ArgumentParser(description='Review the manuscript configured in manuscript.json')
+    parser.add_argument('--resume', metavar='RUN_ID',
+                        help='Resume an interrupted run: only agents and stages without a valid result are run')
+    args = parser.parse_args()
+    
     start_time = time.time()
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Get manuscript
     manuscript = get_local_manuscript()
+    if args.resume:
+        manuscript = resume_run(manuscript, args.resume)
     
     print('manuscript', manuscript)
-        
-    # Run analysis
-    analysis_results = run_analysis.run_analysis(manuscript)    
-    manuscript = manuscript.copy() | analysis_results    
-    
-    # Run quality control
-    quality_control_results = run_quality_control.run_quality_control(manuscript)        
-    manuscript['quality_control_results'] = quality_control_results
-            
-    executive_summary_results = run_executive_summary.run_executive_summary(manuscript)  
-    manuscript['executive_summary_results'] = executive_summary_results
-    
-    current_datetime = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    manuscript['output_path'] = os.path.join(base_dir, 'reports', f'{current_datetime}_review_report.pdf')   
     
-    # Generate PDF
-    pdf_generator.generate_pdf(manuscript)
+    store = get_result_store()
+    run_id = get_run_id(manuscript)
+    try:
+        # Run analysis, quality control and the executive summary as a stage graph;
+        # stages completed in an earlier attempt are skipped
+        manuscript = run_review(manuscript)
+        
+        # Run IDs start with the date and time, so reports still sort chronologically
+        manuscript['output_path'] = os.path.join(base_dir, 'reports', f"{run_id}_review_report.pdf")   
+        os.makedirs(os.path.dirname(manuscript['output_path']), exist_ok=True)
+        
+        # Generate PDF
+        with store.timed(run_id, 'pdf_generation'):
+            pdf_generator.generate_pdf(manuscript)
+    except BaseException:
+        store.finish_run(run_id, status='failed', usage=usage_tracker.summary())
+        print(f"Run {run_id} failed; resume it with: python run_local_aipeer_review.py --resume {run_id}")
+        raise
+    store.finish_run(run_id, usage=usage_tracker.summary())
     
     elapsed_time = time.time() - start_time
     elapsed_minutes = elapsed_time / 60
-    print(f"Code block executed in {elapsed_minutes:.2f} minutes.")    
\ No newline at end of file
+    print(f"Code block executed in {elapsed_minutes:.2f} minutes.")
+    
+    cache = get_response_cache()
+    if cache is not None:
+        print(f"LLM response cache: {cache.stats()}")
+    print(f"LLM token usage: {usage_tracker.summary()}")    
\ No newline at end of file
@@ -1,7 +1,12 @@
 import os
+import sys
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from src.reviewer_agents.quality import QualityControlAgent
+from src.utils.combine_results import AGENT_CATEGORIES, categorize_results
+from src.utils.manuscript import get_manuscript
+from src.utils.result_store import get_result_store, get_run_id
 
 def wait_for_files(file_paths: list, timeout: int = 300, check_interval: int = 5) -> bool:
     """
@@ -16,18 +21,61 @@ def wait_for_files(file_paths: list, timeout: int = 300, check_interval: int = 5
 
 def run_quality_control(inputs):   
     
+    # Quality-control each category on the same parsed manuscript, then assemble the report
+    store = get_result_store()
+    run_id = get_run_id(inputs)
+    inputs = inputs | {'manuscript_data': get_manuscript(inputs)}
+    categories = list(AGENT_CATEGORIES.values())
+    with store.timed(run_id, 'quality_control'):
+        # The categories are independent, so they run concurrently; a failed category does not affect the others
+        with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+            category_results = dict(zip(categories, executor.map(
+                lambda category: run_quality_control_category(inputs, category), categories
+            )))
+        results = assemble_quality_control(inputs, category_results)
+    
+    return results
+
+
+def run_quality_control_category(inputs, category):
+    """Quality-control the agent results of one category, e.g. 'rigor_results'.
+    
+    The categories are independent, so each can run as soon as its own agents finish.
+    """
+    
+    # Agent results not passed in are read from the result store
+    store = get_result_store()
+    run_id = get_run_id(inputs)
+    if category not in inputs:
+        inputs = inputs | categorize_results(store.get_agent_results(run_id))
+    
     # Initialize the quality control agent
     agent = QualityControlAgent()
     
-    # Run the quality control analysis
-    results = agent.process(inputs)
+    # Run the quality control analysis of the category
+    with store.timed(run_id, f'quality_control_{category}'):
+        results = agent.process_category(category, inputs[category], get_manuscript(inputs).text, inputs['context'])
+    
+    # Save the results
+    store.save_results(run_id, 'quality_control_category', {category: results})
+    
+    return results
+
+
+def assemble_quality_control(inputs, category_results):
+    """Assemble the quality control results of all categories into the final report."""
+    store = get_result_store()
+    run_id = get_run_id(inputs)
+    
+    # Copy the categories, as the report fills in the sections that were not applicable
+    results = QualityControlAgent().format_output({
+        category: dict(results) for category, results in category_results.items()
+    })
     
     # Save the results
-    output_path = os.path.join('./results/', 'quality_control_results.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+    store.save_result(run_id, 'quality_control', results)
     
-    print(f"Quality control analysis completed. Results saved to: {output_path}")   
+    print(f"Quality control analysis completed. Results saved to run: {run_id}")   
     
     return results
 
@@ -54,31 +102,20 @@ def create_context_json(manuscript):
 
 if __name__ == '__main__':
     
-    print("Checking for required files...")
-    for f in map(lambda x: os.path.join('./results', x), ['rigor_results.json', 'section_results.json', 'writing_results.json']):
-        if not os.path.exists(f):
-            raise FileNotFoundError(f"Required result file not found: {f}")          
+    print("Checking for required results...")
+    run_id = sys.argv[1] if len(sys.argv) > 1 else get_result_store().latest_run_id()
+    if run_id is None or not get_result_store().get_agent_results(run_id):
+        raise FileNotFoundError(f"Required agent results not found for run: {run_id}")
     
     with open('manuscript.json', "r") as f:
         manuscript = json.load(f)
         
     context_json = create_context_json(manuscript)
-        
-    with open('./results/rigor_results.json', "r") as f:
-        rigor_results_json = json.load(f)
-        
-    with open('./results/section_results.json', "r") as f:
-        section_results_json = json.load(f)
-        
-    with open('./results/writing_results.json', "r") as f:
-        writing_results_json = json.load(f)      
     
     inputs = {
-        'manuscript_src': './manuscripts/manuscript.pdf',        
-        'context': context_json,
-        'rigor_results': rigor_results_json,
-        'section_results': section_results_json,
-        'writing_results': writing_results_json
+        'run_id': run_id,
+        'manuscript_src': get_result_store().get_run(run_id)['source'],        
+        'context': context_json
     } 
     
     run_quality_control(inputs)
\ No newline at end of file
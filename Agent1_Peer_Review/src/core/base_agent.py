@@ -1,13 +1,22 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
 import json
 import os
+import time
 from datetime import datetime
-from openai import OpenAI
 from dotenv import load_dotenv
 from .config import DEFAULT_MODEL
+from .llm_client import get_backend
+from .response_cache import get_response_cache
+from .rate_limiter import call_with_retries, get_rate_limiter
+from .prompt_layout import build_messages
+from .usage import usage_tracker
+from .token_budget import MIN_CHUNK_TOKENS, count_tokens, input_budget, split_into_chunks, merge_chunk_results
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+# Allowance for the system message and chat formatting when budgeting prompts
+SYSTEM_PROMPT_TOKENS = 100
+
 class BaseReviewerAgent:
     """Base class for all reviewer agents."""
     
@@ -23,32 +32,112 @@ class BaseReviewerAgent:
         self.name = self.__class__.__name__
         self.category = "Unknown"
         self.model = model
+        # Manuscript sections the agent reviews (see utils.section_splitter); None means the full text
+        self.sections = None
+        
+        # Borrow the process-wide backend instead of opening a connection pool per agent
+        self.backend = get_backend()
         
-        # Initialize OpenAI client with API key from environment
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(f"OPENAI_API_KEY environment variable not set. Please check {env_path}")
+    def llm(self, prompt: str, document: Optional[str] = None,
+            validate: Optional[Callable[[str], bool]] = None, document_tokens: Optional[int] = None) -> str:
+        """Call the language model with the given prompt, serving repeated requests from the response cache.
         
-        # Print debug info
-        print(f"{self.name} using model: {model}", f"API key found: {'Yes' if api_key else 'No'}")
+        Args:
+            prompt (str): The instructions for the model
+            document (Optional[str]): Manuscript text, sent ahead of the prompt as a shared prefix
+            validate (Optional[Callable[[str], bool]]): Check of the response beyond parsing as
+                JSON, e.g. its shape; responses failing it are neither cached nor served from the cache
+            document_tokens (Optional[int]): Token count of the document, if the caller has counted it
+                already, so it is not counted again for the rate limiter
+            
+        Returns:
+            str: The model's response
+        """
+        messages = build_messages(prompt, document)
+        temperature = 0.3
+        response_format = {"type": "json_object"}
         
-        self.client = OpenAI(api_key=api_key)
+        cache = get_response_cache()
+        if cache is not None:
+            cache_key = cache.make_key(self.model, messages, temperature, response_format, self.backend.cache_namespace)
+            cached = cache.get(cache_key)
+            if cached is not None and (validate is None or validate(cached)):
+                return cached
         
-    def llm(self, prompt: str) -> str:
-        """Call OpenAI API with the given prompt."""
-        try:
-            response = self.client.chat.completions.create(
+        if document is not None and document_tokens is not None:
+            # The document message is messages[1] (see build_messages); its few header tokens are left out
+            prompt_tokens = document_tokens + sum(
+                count_tokens(message["content"], self.model) for i, message in enumerate(messages) if i != 1
+            )
+        else:
+            prompt_tokens = sum(count_tokens(message["content"], self.model) for message in messages)
+        rate_limiter = get_rate_limiter(self.model)
+        
+        def create_completion():
+            rate_limiter.acquire(prompt_tokens)
+            return self.backend.complete(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert academic reviewer. Provide detailed analysis in JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
+                messages=messages,
+                temperature=temperature,
+                response_format=response_format
             )
-            return response.choices[0].message.content
+        
+        try:
+            started = time.perf_counter()
+            response = call_with_retries(create_completion)
+            content = response.content
+            usage_tracker.record(response.usage, time.perf_counter() - started)
         except Exception as e:
             raise Exception(f"Error calling language model: {str(e)}")
+        
+        # Only cache well-formed responses so a malformed one is retried next run
+        if cache is not None and self._is_valid_json(content) and (validate is None or validate(content)):
+            cache.set(cache_key, content)
+        return content
+    
+    def review(self, prompt: str, text: str) -> Dict[str, Any]:
+        """Run the agent's rubric over a text and return the parsed JSON analysis.
+        
+        If the text does not fit into the model's input budget, it is split into
+        overlapping chunks, the rubric is run on each chunk in turn (the agent itself
+        already runs alongside the other agents) and the chunk analyses are merged
+        back into the agent's schema. The text is sent ahead of the rubric so agents
+        reviewing the same text share a prompt prefix.
+        
+        Args:
+            prompt (str): The agent's rubric, without the text
+            text (str): Text content to analyze
+            
+        Returns:
+            Dict[str, Any]: Analysis results
+        """
+        budget = input_budget(self.model) - count_tokens(prompt, self.model) - SYSTEM_PROMPT_TOKENS
+        if budget < MIN_CHUNK_TOKENS:
+            raise ValueError(
+                f"The prompt leaves {budget} of {input_budget(self.model)} input tokens of {self.model} for the "
+                f"manuscript, fewer than {MIN_CHUNK_TOKENS}; shorten the prompt or raise LLM_MAX_INPUT_TOKENS"
+            )
+        text_tokens = count_tokens(text, self.model)
+        if text_tokens <= budget:
+            return json.loads(self.llm(prompt, document=text, document_tokens=text_tokens))
+        
+        chunks = split_into_chunks(text, budget, model=self.model)
+        
+        chunk_results = []
+        for index, chunk in enumerate(chunks):
+            note = (f"Note: the manuscript is too long to review at once. This is part {index + 1} of "
+                    f"{len(chunks)}; base your analysis only on this part.")
+            chunk_results.append(json.loads(self.llm(f"{prompt}\n\n{note}", document=chunk)))
+        return merge_chunk_results(chunk_results)
+    
+    @staticmethod
+    def _is_valid_json(content: str) -> bool:
+        """Check whether a model response parses as JSON."""
+        try:
+            json.loads(content)
+            return True
+        except (TypeError, ValueError):
+            return False
     
     def analyze_section(self, text: str, section_name: str) -> Dict[str, Any]:
         """Analyze a specific section of the manuscript.
@@ -81,7 +170,7 @@ Provide your analysis in the following JSON format:
 Ensure your response is valid JSON and includes all required fields."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self.backend.complete(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": f"You are a {self.name} reviewer."},
@@ -91,7 +180,7 @@ Ensure your response is valid JSON and includes all required fields."""
             )
             
             # Extract JSON from response
-            content = response.choices[0].message.content
+            content = response.content
             start_idx = content.find('{')
             end_idx = content.rfind('}') + 1
             if start_idx >= 0 and end_idx > start_idx:
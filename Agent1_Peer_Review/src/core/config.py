@@ -5,12 +5,99 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# OpenAI API Configuration
+# OpenAI API Configuration (the key is only required by the "openai" backend)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY environment variable is not set")
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-5-nano")
 
+# Maximum number of reviewer agents calling the model at the same time (1 = sequential)
+MAX_CONCURRENT_AGENTS = int(os.getenv("MAX_CONCURRENT_AGENTS", "8"))
+
+# Groups of agents served by a single batched model call, e.g. "W1,W2,W3,W4,W5,W7;R1,R2".
+# Agents that are not in a group are called on their own (default: no batching).
+AGENT_BATCH_GROUPS = [
+    [agent_id.strip() for agent_id in group.split(",") if agent_id.strip()]
+    for group in os.getenv("AGENT_BATCH_GROUPS", "").split(";")
+    if group.strip()
+]
+
+# Language model backend: "openai", "openai_compatible" (any OpenAI-compatible server at
+# LLM_BASE_URL) or "mock" (offline, schema-valid JSON after a synthetic latency)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")
+LLM_BASE_URL = os.getenv("LLM_BASE_URL")
+LLM_MOCK_LATENCY_MEAN = float(os.getenv("LLM_MOCK_LATENCY_MEAN", "1.0"))
+LLM_MOCK_LATENCY_STDDEV = float(os.getenv("LLM_MOCK_LATENCY_STDDEV", "0.0"))
+LLM_MOCK_LATENCY_DISTRIBUTION = os.getenv("LLM_MOCK_LATENCY_DISTRIBUTION", "constant")
+LLM_MOCK_SEED = int(os.getenv("LLM_MOCK_SEED", "0"))
+
+# Shared HTTP connection pool used by all agents
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# Provider quota shared by all concurrent agents, and retry policy for 429/5xx responses
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1.0"))
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "60.0"))
+
+# Context windows used to budget prompts; longer inputs are split into chunks (map-reduce)
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4.1-mini": 1047576,
+    "gpt-4.1-nano": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-5": 400000,
+    "gpt-5-mini": 400000,
+    "gpt-5-nano": 400000
+}
+DEFAULT_CONTEXT_WINDOW = int(os.getenv("DEFAULT_CONTEXT_WINDOW", "128000"))
+RESERVED_OUTPUT_TOKENS = int(os.getenv("RESERVED_OUTPUT_TOKENS", "16000"))
+# Optional hard cap on prompt tokens, regardless of the model's context window (0 = no cap)
+LLM_MAX_INPUT_TOKENS = int(os.getenv("LLM_MAX_INPUT_TOKENS", "0"))
+LLM_CHUNK_OVERLAP_TOKENS = int(os.getenv("LLM_CHUNK_OVERLAP_TOKENS", "500"))
+
+# On-disk cache of model responses, so re-runs on the same manuscript are nearly free
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "cache/llm_responses.sqlite")
+LLM_CACHE_MAX_BYTES = int(float(os.getenv("LLM_CACHE_MAX_MB", "512")) * 1024 * 1024)
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL_DAYS", "30")) * 24 * 3600
+
+# PDF text extraction: documents with at least PDF_PARALLEL_MIN_PAGES pages are split into
+# page ranges extracted by PDF_PARSE_WORKERS processes (1 = always serial)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "64"))
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+# On-disk cache of parsed PDFs keyed by their content, so resubmissions skip parsing
+PDF_CACHE_ENABLED = os.getenv("PDF_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+PDF_CACHE_PATH = os.getenv("PDF_CACHE_PATH", "cache/pdf_parses.sqlite")
+PDF_CACHE_MAX_BYTES = int(float(os.getenv("PDF_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+# Downloads of URL manuscript sources, revalidated with ETag / Last-Modified on reuse
+DOWNLOAD_CACHE_DIR = os.getenv("DOWNLOAD_CACHE_DIR", "cache/downloads")
+DOWNLOAD_MAX_BYTES = int(float(os.getenv("DOWNLOAD_MAX_MB", "100")) * 1024 * 1024)
+DOWNLOAD_CONNECT_TIMEOUT = float(os.getenv("DOWNLOAD_CONNECT_TIMEOUT", "10"))
+DOWNLOAD_READ_TIMEOUT = float(os.getenv("DOWNLOAD_READ_TIMEOUT", "60"))
+DOWNLOAD_POOL_SIZE = int(os.getenv("DOWNLOAD_POOL_SIZE", "4"))
+
+# OCR of pages without a usable text layer (fewer than OCR_MIN_CHARS characters and at least
+# one image): such pages are rendered at OCR_DPI and read by tesseract in OCR_WORKERS processes
+OCR_ENABLED = os.getenv("OCR_ENABLED", "true").lower() in ("1", "true", "yes")
+OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+OCR_LANGUAGE = os.getenv("OCR_LANGUAGE", "eng")
+OCR_MIN_CHARS = int(os.getenv("OCR_MIN_CHARS", "20"))
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(os.cpu_count() or 1)))
+OCR_CACHE_ENABLED = os.getenv("OCR_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+OCR_CACHE_PATH = os.getenv("OCR_CACHE_PATH", "cache/ocr_pages.sqlite")
+OCR_CACHE_MAX_BYTES = int(float(os.getenv("OCR_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+# Store of review runs (SQLite in WAL mode): agent results, quality control, executive summary,
+# timings and usage per run ID. With WRITE_AGENT_RESULT_FILES, each run is also exported to
+# results/<run_id>/ as a bundle file and one {agent_id}_results.json file per agent
+RESULT_STORE_PATH = os.getenv("RESULT_STORE_PATH", "results/results.sqlite")
+WRITE_AGENT_RESULT_FILES = os.getenv("WRITE_AGENT_RESULT_FILES", "false").lower() in ("1", "true", "yes")
+
 # Agent configurations
 AGENT_CONFIGS = {
     "scientific_rigor": [
@@ -284,7 +371,7 @@ PDF_PROCESSOR_CONFIG = {
     "supported_formats": ["pdf"],
     "max_pages": 100,
     "image_quality": "high",
-    "ocr_enabled": True
+    "ocr_enabled": OCR_ENABLED
 }
 
 # File Paths
@@ -0,0 +1,266 @@
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import httpx
+from openai import OpenAI
+from .config import LLM_MAX_CONNECTIONS, LLM_KEEPALIVE_EXPIRY, LLM_HTTP2
+from .token_budget import count_tokens
+
+
+class LLMUsage:
+    """Token usage of a completion, mirroring the `usage` block of the OpenAI API."""
+    
+    def __init__(self, prompt_tokens: int = 0, completion_tokens: int = 0, cached_tokens: int = 0):
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.cached_tokens = cached_tokens
+
+
+class LLMResponse:
+    """Text content and token usage of a completion."""
+    
+    def __init__(self, content: str, usage: Optional[LLMUsage] = None):
+        self.content = content
+        self.usage = usage
+
+
+class LLMBackend:
+    """Interface of the language model backends used by the agents."""
+    
+    @property
+    def cache_namespace(self) -> str:
+        """Identify the service answering the requests, so cached responses of different backends never mix."""
+        return type(self).__name__
+    
+    def complete(self, model: str, messages: List[Dict[str, str]], temperature: Optional[float] = None,
+                 response_format: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """Run a chat completion.
+        
+        Args:
+            model (str): Model name
+            messages (List[Dict[str, str]]): Chat messages
+            temperature (Optional[float]): Sampling temperature
+            response_format (Optional[Dict[str, Any]]): Requested response format
+            
+        Returns:
+            LLMResponse: The completion
+        """
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        pass
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed by httpx for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class OpenAIBackend(LLMBackend):
+    """Backend for the OpenAI API, using one pooled HTTP client with keep-alive."""
+    
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        """
+        Initialize the OpenAI backend.
+        
+        Args:
+            api_key (str): API key
+            base_url (Optional[str]): API base URL, None for the OpenAI default
+        """
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+            ),
+            http2=LLM_HTTP2 and _http2_available(),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
+        self.base_url = base_url
+        # Retries are handled by rate_limiter.call_with_retries
+        self.client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0)
+    
+    @property
+    def cache_namespace(self) -> str:
+        """The backend and the server it talks to."""
+        return f"{type(self).__name__}:{self.base_url or ''}"
+    
+    def complete(self, model: str, messages: List[Dict[str, str]], temperature: Optional[float] = None,
+                 response_format: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """Run a chat completion against the API."""
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        response = self.client.chat.completions.create(model=model, messages=messages, **kwargs)
+        
+        usage = None
+        if getattr(response, "usage", None) is not None:
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            usage = LLMUsage(
+                prompt_tokens=response.usage.prompt_tokens or 0,
+                completion_tokens=response.usage.completion_tokens or 0,
+                cached_tokens=getattr(details, "cached_tokens", None) or 0
+            )
+        return LLMResponse(response.choices[0].message.content, usage)
+    
+    def close(self) -> None:
+        """Close the HTTP connection pool."""
+        self.client.close()
+
+
+class OpenAICompatibleBackend(OpenAIBackend):
+    """Backend for any server implementing the OpenAI chat completions API (vLLM, Ollama, LM Studio, ...)."""
+    
+    def __init__(self, base_url: str, api_key: Optional[str] = None):
+        """
+        Initialize the backend.
+        
+        Args:
+            base_url (str): API base URL, e.g. http://localhost:8000/v1
+            api_key (Optional[str]): API key, if the server requires one
+        """
+        if not base_url:
+            raise ValueError("LLM_BASE_URL environment variable not set")
+        # Local servers often do not check the key, but the client requires one
+        super().__init__(api_key or "not-needed", base_url=base_url)
+
+
+class MockBackend(LLMBackend):
+    """Offline backend returning deterministic, schema-valid JSON after a synthetic latency.
+    
+    The response is derived from the JSON format requested in the prompt, so every
+    agent receives output in its own schema. Latencies are drawn from a seeded
+    distribution, so benchmark runs are reproducible.
+    """
+    
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+    
+    def __init__(self, latency_mean: float = 1.0, latency_stddev: float = 0.0,
+                 distribution: str = "constant", seed: int = 0):
+        """
+        Initialize the mock backend.
+        
+        Args:
+            latency_mean (float): Mean latency of a call in seconds
+            latency_stddev (float): Standard deviation of the latency in seconds
+            distribution (str): One of "constant", "uniform", "normal" or "lognormal"
+            seed (int): Seed of the latency generator
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown mock latency distribution: {distribution}")
+        self.latency_mean = latency_mean
+        self.latency_stddev = latency_stddev
+        self.distribution = distribution
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def sample_latency(self) -> float:
+        """Draw the latency of the next call in seconds."""
+        mean, stddev = self.latency_mean, self.latency_stddev
+        with self._lock:
+            if self.distribution == "constant" or stddev <= 0 or mean <= 0:
+                latency = mean
+            elif self.distribution == "uniform":
+                # Uniform distribution with the given mean and standard deviation
+                half_width = stddev * 3 ** 0.5
+                latency = self._random.uniform(mean - half_width, mean + half_width)
+            elif self.distribution == "normal":
+                latency = self._random.gauss(mean, stddev)
+            else:
+                # Log-normal distribution parameterised by its mean and standard deviation
+                sigma2 = math.log(1 + (stddev / mean) ** 2)
+                mu = math.log(mean) - sigma2 / 2
+                latency = self._random.lognormvariate(mu, sigma2 ** 0.5)
+        return max(0.0, latency)
+    
+    def complete(self, model: str, messages: List[Dict[str, str]], temperature: Optional[float] = None,
+                 response_format: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """Return a mock completion for the last message after a synthetic delay."""
+        time.sleep(self.sample_latency())
+        content = mock_json_response(messages[-1]["content"])
+        usage = LLMUsage(
+            prompt_tokens=sum(count_tokens(message["content"], model) for message in messages),
+            completion_tokens=count_tokens(content, model)
+        )
+        return LLMResponse(content, usage)
+
+
+# Phrases that introduce the JSON format requested by a prompt
+_FORMAT_MARKERS = ("JSON format:", "this structure:")
+_BATCH_SECTION = re.compile(r'^=== Review (\w+) ===$', re.MULTILINE)
+_PLACEHOLDERS = [
+    (re.compile(r':\s*\[\s*str\s*\]'), ': ["Mock text"]'),
+    (re.compile(r':\s*int\b'), ': 3'),
+    (re.compile(r':\s*float\b'), ': 0.5'),
+    (re.compile(r':\s*bool\b'), ': true'),
+    (re.compile(r':\s*str\b'), ': "Mock text"'),
+    (re.compile(r':\s*<[^>\n]*>'), ': 3'),
+]
+
+
+def _extract_template(prompt: str) -> Optional[Any]:
+    """Turn the JSON format described at the end of a prompt into a sample value."""
+    positions = [prompt.rfind(marker) for marker in _FORMAT_MARKERS]
+    start = prompt.find('{', max(positions))
+    if max(positions) < 0 or start < 0:
+        return None
+    
+    # Drop "# ..." annotations, then take the balanced {...} block
+    tail = re.sub(r'#[^\n]*', '', prompt[start:])
+    depth = 0
+    for index, char in enumerate(tail):
+        depth += {'{': 1, '}': -1}.get(char, 0)
+        if depth == 0:
+            break
+    block = tail[:index + 1]
+    
+    for pattern, replacement in _PLACEHOLDERS:
+        block = pattern.sub(replacement, block)
+    block = re.sub(r',(\s*[}\]])', r'\1', block)
+    try:
+        return json.loads(block)
+    except ValueError:
+        return None
+
+
+def mock_json_response(prompt: str) -> str:
+    """Build a deterministic JSON response matching the format requested by a prompt."""
+    batch_ids = _BATCH_SECTION.findall(prompt)
+    if batch_ids:
+        parts = _BATCH_SECTION.split(prompt)[1:]
+        result = {
+            agent_id: _extract_template(section) or _generic_result(section)
+            for agent_id, section in zip(parts[0::2], parts[1::2])
+        }
+    else:
+        result = _extract_template(prompt) or _generic_result(prompt)
+    return json.dumps(result)
+
+
+def _generic_result(prompt: str) -> Dict[str, Any]:
+    """Fallback response for prompts without a parseable JSON format."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+    return {
+        "title": "Mock Manuscript Title",
+        "executive_summary": f"Mock executive summary ({digest}).",
+        "score": 3,
+        "critical_remarks": [],
+        "improvement_suggestions": [],
+        "detailed_feedback": {},
+        "summary": f"Mock analysis ({digest})."
+    }
@@ -0,0 +1,63 @@
+from typing import Optional
+import os
+import threading
+from .config import (LLM_BACKEND, LLM_BASE_URL, LLM_MOCK_LATENCY_MEAN, LLM_MOCK_LATENCY_STDDEV,
+                     LLM_MOCK_LATENCY_DISTRIBUTION, LLM_MOCK_SEED)
+from .llm_backends import LLMBackend, OpenAIBackend, OpenAICompatibleBackend, MockBackend
+
+# Process-wide backend shared by all agents so they reuse warm connections
+_backend: Optional[LLMBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name: str = LLM_BACKEND) -> LLMBackend:
+    """Create the language model backend selected by name.
+    
+    Args:
+        name (str): "openai", "openai_compatible" or "mock"
+        
+    Returns:
+        LLMBackend: The backend
+    """
+    if name == "openai":
+        return OpenAIBackend(os.getenv("OPENAI_API_KEY"))
+    if name == "openai_compatible":
+        return OpenAICompatibleBackend(LLM_BASE_URL, os.getenv("OPENAI_API_KEY"))
+    if name == "mock":
+        return MockBackend(
+            latency_mean=LLM_MOCK_LATENCY_MEAN,
+            latency_stddev=LLM_MOCK_LATENCY_STDDEV,
+            distribution=LLM_MOCK_LATENCY_DISTRIBUTION,
+            seed=LLM_MOCK_SEED
+        )
+    raise ValueError(f"Unknown LLM backend: {name}")
+
+
+def get_backend() -> LLMBackend:
+    """Return the shared language model backend, creating it on first use.
+    
+    Returns:
+        LLMBackend: The shared backend
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_backend()
+    return _backend
+
+
+def set_backend(backend: Optional[LLMBackend]) -> None:
+    """Replace the shared backend, e.g. with a MockBackend for benchmarks."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def close_backend() -> None:
+    """Close the shared backend and its connection pool."""
+    global _backend
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+            _backend = None
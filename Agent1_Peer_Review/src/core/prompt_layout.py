@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+
+# Shared by every agent so that it forms the start of a common, cacheable prefix
+SYSTEM_PROMPT = "You are an expert academic reviewer. Provide detailed analysis in JSON format."
+
+
+def build_messages(prompt: str, document: Optional[str] = None) -> List[Dict[str, str]]:
+    """Assemble the chat messages for an agent call.
+    
+    The system message and the manuscript text come first and are byte-identical
+    for every agent that reviews the same text, followed by the agent's rubric.
+    Providers that cache prompt prefixes can then reuse the bulk of the input
+    tokens across agents.
+    
+    Args:
+        prompt (str): The agent's rubric and instructions
+        document (Optional[str]): The manuscript text to review, if any
+        
+    Returns:
+        List[Dict[str, str]]: Chat messages
+    """
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    if document is not None:
+        messages.append({"role": "user", "content": f"Text to analyze:\n\n{document}"})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def build_batch_prompt(prompts: Dict[str, str]) -> str:
+    """Combine the rubrics of several agents into a single prompt.
+    
+    The model is asked to return one JSON object keyed by agent ID, with each
+    value following the schema of that agent's rubric.
+    
+    Args:
+        prompts (Dict[str, str]): Rubric per agent ID
+        
+    Returns:
+        str: The combined prompt
+    """
+    agent_ids = ', '.join(f'"{agent_id}"' for agent_id in prompts)
+    sections = [
+        f"=== Review {agent_id} ===\n{prompt.strip()}"
+        for agent_id, prompt in prompts.items()
+    ]
+    return (
+        "Perform the following independent reviews of the text above. Each review has its own "
+        "instructions and JSON format.\n\n"
+        + "\n\n".join(sections)
+        + f"\n\nReturn a single JSON object with exactly these keys: {agent_ids}. The value of each key "
+        "must be the complete JSON result of that review, in exactly the format requested for it."
+    )
@@ -0,0 +1,118 @@
+from typing import Any, Callable, Dict, Optional
+from collections import deque
+import random
+import threading
+import time
+import openai
+from .config import (LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_MAX_RETRIES,
+                     LLM_BACKOFF_BASE, LLM_BACKOFF_MAX)
+
+
+class RateLimiter:
+    """Sliding-window limiter on requests per minute and tokens per minute.
+    
+    Each call reserves one request and its estimated prompt tokens. Callers block
+    until both budgets of the last minute allow the call, so concurrent agents
+    run at the quota ceiling instead of being rejected by the provider.
+    """
+    
+    def __init__(self, requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = LLM_TOKENS_PER_MINUTE, window: float = 60.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            requests_per_minute (int): Maximum number of requests per window
+            tokens_per_minute (int): Maximum number of prompt tokens per window
+            window (float): Length of the sliding window in seconds
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._calls = deque()  # (timestamp, tokens) of calls inside the window
+        self._tokens_in_window = 0
+        self._condition = threading.Condition()
+    
+    def acquire(self, tokens: int) -> None:
+        """Block until a call with the given token budget fits into both limits."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0][0] >= self.window:
+                    self._tokens_in_window -= self._calls.popleft()[1]
+                
+                # An oversized call is let through alone rather than blocking forever
+                fits_tokens = self._tokens_in_window + tokens <= self.tokens_per_minute or not self._calls
+                if len(self._calls) < self.requests_per_minute and fits_tokens:
+                    self._calls.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+                
+                self._condition.wait(self._calls[0][0] + self.window - now)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status code of an API error, if any."""
+    return getattr(error, "status_code", None)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Return the delay requested by the provider via Retry-After headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        # Retry-After may also be an HTTP date; fall back to exponential backoff
+        return None
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether an API error is transient (rate limit, server error or connection issue)."""
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    status = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def call_with_retries(call: Callable[[], Any], max_retries: int = LLM_MAX_RETRIES,
+                      base_delay: float = LLM_BACKOFF_BASE, max_delay: float = LLM_BACKOFF_MAX) -> Any:
+    """Run an API call, retrying transient failures with jittered exponential backoff.
+    
+    Args:
+        call (Callable[[], Any]): The API call to run
+        max_retries (int): Maximum number of retries after the first attempt
+        base_delay (float): Backoff delay of the first retry in seconds
+        max_delay (float): Upper bound of the backoff delay in seconds
+        
+    Returns:
+        Any: The result of the call
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            time.sleep(min(delay, max_delay))
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: str) -> RateLimiter:
+    """Return the process-wide rate limiter for a model (provider quotas are per model)."""
+    with _limiters_lock:
+        if model not in _limiters:
+            _limiters[model] = RateLimiter()
+        return _limiters[model]
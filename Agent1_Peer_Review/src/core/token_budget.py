@@ -0,0 +1,139 @@
+from typing import Any, Dict, List
+import json
+import re
+from .config import (MODEL_CONTEXT_WINDOWS, DEFAULT_CONTEXT_WINDOW, RESERVED_OUTPUT_TOKENS,
+                     LLM_MAX_INPUT_TOKENS, LLM_CHUNK_OVERLAP_TOKENS)
+
+try:
+    import tiktoken
+except ImportError:  # Optional dependency; fall back to a character-based estimate
+    tiktoken = None
+
+# Average number of characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Smallest share of the input budget worth sending as a chunk of the manuscript
+MIN_CHUNK_TOKENS = 256
+
+
+def _encoding(model: str):
+    """Return the tiktoken encoding for a model, or None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    """Count the tokens of a text locally (exact with tiktoken, estimated otherwise)."""
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def input_budget(model: str) -> int:
+    """Return the maximum number of prompt tokens for a model, keeping room for the response."""
+    if LLM_MAX_INPUT_TOKENS:
+        return LLM_MAX_INPUT_TOKENS
+    # Match the longest known prefix so dated snapshots (e.g. gpt-4.1-2025-04-14) are covered
+    matches = [name for name in MODEL_CONTEXT_WINDOWS if model.startswith(name)]
+    window = MODEL_CONTEXT_WINDOWS[max(matches, key=len)] if matches else DEFAULT_CONTEXT_WINDOW
+    return window - RESERVED_OUTPUT_TOKENS
+
+
+def split_into_chunks(text: str, max_tokens: int, overlap_tokens: int = LLM_CHUNK_OVERLAP_TOKENS,
+                      model: str = "") -> List[str]:
+    """Split text into chunks of at most max_tokens, overlapping by about overlap_tokens.
+    
+    Chunks are cut at paragraph boundaries where possible; paragraphs longer than a
+    chunk are cut by characters.
+    
+    Args:
+        text (str): Text to split
+        max_tokens (int): Maximum number of tokens per chunk
+        overlap_tokens (int): Number of tokens repeated from the end of the previous chunk
+        model (str): Model used to count tokens
+        
+    Returns:
+        List[str]: The chunks in document order
+    """
+    if max_tokens <= 0:
+        raise ValueError(f"Chunk size must be positive, got {max_tokens} tokens")
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    paragraphs = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        if count_tokens(paragraph, model) > max_tokens:
+            paragraphs.extend(paragraph[i:i + max_chars] for i in range(0, len(paragraph), max_chars))
+        elif paragraph.strip():
+            paragraphs.append(paragraph)
+    
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for paragraph in paragraphs:
+        paragraph_tokens = count_tokens(paragraph, model)
+        if current and current_tokens + paragraph_tokens > max_tokens:
+            chunks.append('\n\n'.join(current))
+            # Carry trailing paragraphs over so context is not lost at the boundary
+            overlap: List[str] = []
+            overlap_size = 0
+            for previous in reversed(current):
+                previous_tokens = count_tokens(previous, model)
+                if overlap_size + previous_tokens > overlap_tokens or overlap_size + previous_tokens + paragraph_tokens > max_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += previous_tokens
+            current, current_tokens = overlap, overlap_size
+        current.append(paragraph)
+        current_tokens += paragraph_tokens
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+
+def merge_chunk_results(results: List[Any]) -> Any:
+    """Merge per-chunk agent outputs back into a single output with the same schema.
+    
+    Numbers (scores) are averaged, lists are concatenated without duplicates,
+    dictionaries are merged key by key and distinct texts are joined.
+    """
+    values = [value for value in results if value is not None]
+    if not values:
+        return None
+    first = values[0]
+    
+    if isinstance(first, bool):
+        return any(values)
+    if isinstance(first, (int, float)):
+        numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        mean = sum(numbers) / len(numbers)
+        return round(mean) if all(isinstance(value, int) for value in numbers) else mean
+    if isinstance(first, dict):
+        merged = {}
+        for value in values:
+            if isinstance(value, dict):
+                for key in value:
+                    merged.setdefault(key, None)
+        for key in merged:
+            merged[key] = merge_chunk_results([value.get(key) for value in values if isinstance(value, dict)])
+        return merged
+    if isinstance(first, list):
+        merged_list = []
+        seen = set()
+        for value in values:
+            for item in value if isinstance(value, list) else [value]:
+                fingerprint = json.dumps(item, sort_keys=True)
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    merged_list.append(item)
+        return merged_list
+    if isinstance(first, str):
+        texts = []
+        for value in values:
+            if isinstance(value, str) and value.strip() and value not in texts:
+                texts.append(value)
+        return '\n\n'.join(texts)
+    return first
@@ -0,0 +1,55 @@
+from typing import Any, Dict
+import threading
+
+
+class UsageTracker:
+    """Thread-safe accumulator of token usage reported by the language model backend."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.completion_tokens = 0
+            self.wait_seconds = 0.0
+    
+    def record(self, usage: Any, wait_seconds: float = 0.0) -> None:
+        """Add the token usage of a completion (an LLMUsage) and the time spent waiting for it."""
+        with self._lock:
+            self.wait_seconds += wait_seconds
+            if usage is None:
+                return
+            self.calls += 1
+            self.prompt_tokens += usage.prompt_tokens
+            self.cached_tokens += usage.cached_tokens
+            self.completion_tokens += usage.completion_tokens
+    
+    def add_summary(self, summary: Dict[str, Any]) -> None:
+        """Add the counters of an earlier summary, e.g. of an interrupted attempt of a resumed run."""
+        with self._lock:
+            self.calls += summary.get("calls", 0)
+            self.prompt_tokens += summary.get("prompt_tokens", 0)
+            self.cached_tokens += summary.get("cached_tokens", 0)
+            self.completion_tokens += summary.get("completion_tokens", 0)
+            self.wait_seconds += summary.get("wait_seconds", 0.0)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Return the counters and the share of prompt tokens served from the provider cache."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "completion_tokens": self.completion_tokens,
+                "wait_seconds": self.wait_seconds,
+                "cached_ratio": self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+            }
+
+
+# Process-wide usage of all agents
+usage_tracker = UsageTracker()
@@ -1,11 +1,15 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
 import json
 import os
 from datetime import datetime
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ..core.base_agent import BaseReviewerAgent
+from ..core.config import MAX_CONCURRENT_AGENTS, AGENT_BATCH_GROUPS
+from ..core.prompt_layout import build_batch_prompt
+from ..utils.section_splitter import split_sections, select_sections
 
 # Section agents
 from .section.S1_title_keywords_agent import TitleKeywordsAgentS1
@@ -40,8 +44,10 @@ from .writing.W7_target_audience_agent import TargetAudienceAlignmentAgent
 class ControllerAgent:
     """Controller agent that coordinates all reviewer agents."""
     
-    def __init__(self, model="gpt-4.1-nano"):
+    def __init__(self, model="gpt-4.1-nano", batch_groups: List[List[str]] = AGENT_BATCH_GROUPS):
         self.model = model
+        # Groups of agent IDs served by a single batched model call
+        self.batch_groups = batch_groups
         self.agents = {
             # Section agents
             'S1': TitleKeywordsAgentS1(model),
@@ -73,50 +79,157 @@ class ControllerAgent:
             'W6': CitationFormattingAgent(model),
             'W7': TargetAudienceAlignmentAgent(model)
         }
+        
+        # Analysis entry point of each agent
+        self.analysis_methods = {
+            'S1': 'analyze_title_keywords',
+            'S2': 'analyze_abstract',
+            'S3': 'analyze_introduction',
+            'S4': 'analyze_literature_review',
+            'S5': 'analyze_methodology',
+            'S6': 'analyze_results',
+            'S7': 'analyze_discussion',
+            'S8': 'analyze_conclusion',
+            'S9': 'analyze_references',
+            'S10': 'analyze_supplementary_materials',
+            'R1': 'analyze_originality_contribution',
+            'R2': 'analyze_impact_significance',
+            'R3': 'analyze_ethics_compliance',
+            'R4': 'analyze_data_code_availability',
+            'R5': 'analyze_statistical_rigor',
+            'R6': 'analyze_technical_accuracy',
+            'R7': 'analyze_consistency',
+            'W1': 'analyze_language_style',
+            'W2': 'analyze_narrative_structure',
+            'W3': 'analyze_clarity_conciseness',
+            'W4': 'analyze_terminology_consistency',
+            'W5': 'analyze_inclusive_language',
+            'W6': 'analyze_citation_formatting',
+            'W7': 'analyze_target_audience_alignment'
+        }
     
-    def run_analysis(self, text: str) -> Dict[str, Any]:
-        """Runs analyses using all agents."""
+    def run_analysis(self, text: str, max_workers: int = MAX_CONCURRENT_AGENTS,
+                     sections: Optional[Dict[str, str]] = None, completed: Optional[Dict[str, Any]] = None,
+                     on_results: Optional[Callable[[Dict[str, Any]], None]] = None,
+                     agent_ids: Optional[List[str]] = None, executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """Runs analyses using all agents, or the given agents.
+        
+        Args:
+            text (str): Manuscript text to analyze
+            max_workers (int): Maximum number of agent calls in flight at once.
+                A value of 1 runs the agents one after another.
+            sections (Dict[str, str], optional): Text per canonical section, e.g.
+                Manuscript.section_texts; split from the text by wording if omitted
+            completed (Dict[str, Any], optional): Agent results of an earlier attempt;
+                these agents are not run again
+            on_results (Callable, optional): Called with the results of each agent or
+                batch as soon as it finishes, e.g. to checkpoint them
+            agent_ids (List[str], optional): Agents to run, e.g. those of one category
+                (default: all agents)
+            executor (Executor, optional): Pool shared with other analyses running at
+                the same time, bounding their agent calls together; max_workers is
+                ignored if given
+            
+        Returns:
+            Dict[str, Any]: Agent results keyed by agent ID (S1..W7, or the given agents)
+        """
         try:
+            # Split the manuscript once and give each agent only the sections it reviews
+            if sections is None:
+                sections = split_sections(text)
+            
             # Determine research type
             research_type = self._determine_research_type(text)
             
-            # Run analyses for each agent
-            results = {}
+            # Each unit is a single agent or a batch of agents served by one call
+            completed = completed or {}
+            agent_ids = [agent_id for agent_id in self.agents if agent_ids is None or agent_id in agent_ids]
+            units = self._plan_units([agent_id for agent_id in agent_ids if agent_id not in completed])
+            unit_texts = [self._select_unit_text(unit, sections, text) for unit in units]
             
-            # Run section agent analyses
-            results["S1"] = self.agents["S1"].analyze_title_keywords(text, research_type)
-            results["S2"] = self.agents["S2"].analyze_abstract(text, research_type)
-            results["S3"] = self.agents["S3"].analyze_introduction(text, research_type)
-            results["S4"] = self.agents["S4"].analyze_literature_review(text, research_type)
-            results["S5"] = self.agents["S5"].analyze_methodology(text, research_type)
-            results["S6"] = self.agents["S6"].analyze_results(text, research_type)
-            results["S7"] = self.agents["S7"].analyze_discussion(text, research_type)
-            results["S8"] = self.agents["S8"].analyze_conclusion(text, research_type)
-            results["S9"] = self.agents["S9"].analyze_references(text, research_type)
-            results["S10"] = self.agents["S10"].analyze_supplementary_materials(text, research_type)
+            def run_unit(unit: List[str], unit_text: str) -> Dict[str, Any]:
+                unit_result = self._run_unit(unit, unit_text, research_type, sections, text)
+                if on_results is not None:
+                    on_results(unit_result)
+                return unit_result
             
-            # Run rigor agent analyses
-            results["R1"] = self.agents["R1"].analyze_originality_contribution(text, research_type)
-            results["R2"] = self.agents["R2"].analyze_impact_significance(text, research_type)
-            results["R3"] = self.agents["R3"].analyze_ethics_compliance(text, research_type)
-            results["R4"] = self.agents["R4"].analyze_data_code_availability(text, research_type)
-            results["R5"] = self.agents["R5"].analyze_statistical_rigor(text, research_type)
-            results["R6"] = self.agents["R6"].analyze_technical_accuracy(text, research_type)
-            results["R7"] = self.agents["R7"].analyze_consistency(text, research_type)
+            if executor is not None:
+                futures = [executor.submit(run_unit, unit, unit_text) for unit, unit_text in zip(units, unit_texts)]
+                unit_results = [future.result() for future in futures]
+            elif max_workers <= 1:
+                unit_results = [run_unit(unit, unit_text) for unit, unit_text in zip(units, unit_texts)]
+            else:
+                # The units are independent, so fan them out over a bounded pool
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(run_unit, unit, unit_text) for unit, unit_text in zip(units, unit_texts)]
+                    unit_results = [future.result() for future in futures]
             
-            # Run writing agent analyses
-            results["W1"] = self.agents["W1"].analyze_language_style(text, research_type)
-            results["W2"] = self.agents["W2"].analyze_narrative_structure(text, research_type)
-            results["W3"] = self.agents["W3"].analyze_clarity_conciseness(text, research_type)
-            results["W4"] = self.agents["W4"].analyze_terminology_consistency(text, research_type)
-            results["W5"] = self.agents["W5"].analyze_inclusive_language(text, research_type)
-            results["W6"] = self.agents["W6"].analyze_citation_formatting(text, research_type)
-            results["W7"] = self.agents["W7"].analyze_target_audience_alignment(text, research_type)
-            
-            return results
+            # Reassemble in agent order so the results dict stays keyed S1..W7
+            results = dict(completed)
+            for unit_result in unit_results:
+                results.update(unit_result)
+            return {agent_id: results[agent_id] for agent_id in agent_ids}
         except Exception as e:
             return self._generate_error_report(f"Error in analysis: {str(e)}")
     
+    def _plan_units(self, agent_ids: List[str]) -> List[List[str]]:
+        """Groups agents into batched units according to the configured batch groups."""
+        units = []
+        batched = set()
+        for group in self.batch_groups:
+            group = [agent_id for agent_id in group if agent_id in agent_ids and agent_id not in batched]
+            if len(group) > 1:
+                units.append(group)
+                batched.update(group)
+        units.extend([agent_id] for agent_id in agent_ids if agent_id not in batched)
+        return units
+    
+    def _select_unit_text(self, unit: List[str], sections: Dict[str, str], text: str) -> str:
+        """Returns the text covering the sections of all agents in a unit."""
+        if any(self.agents[agent_id].sections is None for agent_id in unit):
+            return select_sections(sections, None, text)
+        names = sorted({name for agent_id in unit for name in self.agents[agent_id].sections})
+        return select_sections(sections, names, text)
+    
+    def _run_unit(self, unit: List[str], text: str, research_type: str, sections: Dict[str, str],
+                  full_text: str) -> Dict[str, Any]:
+        """Runs a single agent or a batch of agents on the text of the unit."""
+        if len(unit) == 1:
+            return {unit[0]: self._run_agent(unit[0], text, research_type)}
+        return self._run_batch(unit, text, research_type, sections, full_text)
+    
+    def _run_agent(self, agent_id: str, text: str, research_type: str) -> Dict[str, Any]:
+        """Runs a single agent, isolating its failure from the other agents."""
+        try:
+            analyze = getattr(self.agents[agent_id], self.analysis_methods[agent_id])
+            return analyze(text, research_type)
+        except Exception as e:
+            return self._generate_error_report(f"Error in agent {agent_id}: {str(e)}")
+    
+    def _run_batch(self, unit: List[str], text: str, research_type: str, sections: Dict[str, str],
+                   full_text: str) -> Dict[str, Any]:
+        """Runs several agents with one model call that returns a JSON object keyed by agent ID.
+        
+        Agents whose result is missing or malformed in the batched response, or all
+        agents of the batch if the call fails, fall back to individual calls on their
+        own sections, as if they were not batched.
+        """
+        results = {}
+        try:
+            prompts = {agent_id: self.agents[agent_id].build_prompt(research_type) for agent_id in unit}
+            combined = self.agents[unit[0]].review(build_batch_prompt(prompts), text)
+            for agent_id in unit:
+                if isinstance(combined.get(agent_id), dict):
+                    results[agent_id] = combined[agent_id]
+        except Exception as e:
+            print(f"Batched call for {', '.join(unit)} failed, falling back to individual calls: {str(e)}")
+        
+        for agent_id in unit:
+            if agent_id not in results:
+                agent_text = self._select_unit_text([agent_id], sections, full_text)
+                results[agent_id] = self._run_agent(agent_id, agent_text, research_type)
+        return results
+    
     def _determine_research_type(self, text: str) -> str:
         """Determine the type of research paper."""
         # Simple heuristic based on keywords
@@ -1,10 +1,8 @@
 import json
 import os
 from typing import Dict, Any
-import PyPDF2
-import requests
-from io import BytesIO
 from ..core.base_agent import BaseReviewerAgent
+from ..utils.manuscript import get_manuscript
 
 class ExecutiveSummaryAgent(BaseReviewerAgent):
     """
@@ -25,44 +23,6 @@ class ExecutiveSummaryAgent(BaseReviewerAgent):
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def extract_pdf_text(self, pdf_source: str) -> str:
-        """Extract text from a PDF file or URL."""
-        text = ""
-    
-        if pdf_source.startswith("http://") or pdf_source.startswith("https://"):
-            # Source is a URL
-            response = requests.get(pdf_source)
-            response.raise_for_status()  # Raises error if the download failed
-            pdf_file = BytesIO(response.content)
-        else:
-            # Source is a local file path
-            pdf_file = open(pdf_source, 'rb')
-        
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page in pdf_reader.pages:
-                extracted_text = page.extract_text()
-                if extracted_text:
-                    text += extracted_text + "\n"
-        finally:
-            if not isinstance(pdf_file, BytesIO):
-                pdf_file.close()
-        
-        return text
-
-    def extract_title(self, pdf_path: str) -> str:
-        """Extract title from the first page of the PDF."""
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            first_page = pdf_reader.pages[0]
-            text = first_page.extract_text()
-            # Assuming title is in the first few lines
-            lines = text.split('\n')
-            for line in lines[:5]:  # Check first 5 lines
-                if line.strip() and len(line.strip()) > 10:  # Basic title validation
-                    return line.strip()
-        return "Title not found"
-
     def calculate_scores(self, quality_control_results: Dict) -> Dict[str, float]:
         """Calculate overall scores from quality control results."""
         scores = {
@@ -76,8 +36,9 @@ class ExecutiveSummaryAgent(BaseReviewerAgent):
         section_scores = []
         for i in range(1, 11):
             section_key = f'S{i}'
-            if section_key in quality_control_results.get('section_results', {}):
-                section_scores.append(quality_control_results['section_results'][section_key]['score'])
+            result = quality_control_results.get('section_results', {}).get(section_key)
+            if result is not None and not result.get('error'):
+                section_scores.append(result['score'])
         if section_scores:
             scores['section_score'] = sum(section_scores) / len(section_scores)
         
@@ -85,8 +46,9 @@ class ExecutiveSummaryAgent(BaseReviewerAgent):
         rigor_scores = []
         for i in range(1, 8):
             rigor_key = f'R{i}'
-            if rigor_key in quality_control_results.get('rigor_results', {}):
-                rigor_scores.append(quality_control_results['rigor_results'][rigor_key]['score'])
+            result = quality_control_results.get('rigor_results', {}).get(rigor_key)
+            if result is not None and not result.get('error'):
+                rigor_scores.append(result['score'])
         if rigor_scores:
             scores['rigor_score'] = sum(rigor_scores) / len(rigor_scores)
         
@@ -94,13 +56,18 @@ class ExecutiveSummaryAgent(BaseReviewerAgent):
         writing_scores = []
         for i in range(1, 8):
             writing_key = f'W{i}'
-            if writing_key in quality_control_results.get('writing_results', {}):
-                writing_scores.append(quality_control_results['writing_results'][writing_key]['score'])
+            result = quality_control_results.get('writing_results', {}).get(writing_key)
+            if result is not None and not result.get('error'):
+                writing_scores.append(result['score'])
         if writing_scores:
             scores['writing_score'] = sum(writing_scores) / len(writing_scores)
         
-        # Calculate final score
-        category_scores = [scores['section_score'], scores['rigor_score'], scores['writing_score']]
+        # Calculate final score from the categories with scores; sections whose quality control failed have none
+        category_scores = [
+            scores[name] for name, category in [('section_score', section_scores), ('rigor_score', rigor_scores),
+                                                ('writing_score', writing_scores)]
+            if category
+        ]
         if category_scores:
             scores['final_score'] = sum(category_scores) / len(category_scores)
         
@@ -217,11 +184,12 @@ Keep the summary within half a page (about 250 words), use professional language
         context = inputs['context']
         quality_control_results = inputs['quality_control_results']
         
-        # Extract manuscript text       
-        manuscript_text = self.extract_pdf_text(inputs['manuscript_src'])
-        
-        # Step 1: Generate independent review
-        independent_review = self.generate_independent_review(manuscript_text, context)
+        # Step 1: Generate independent review, unless it was generated ahead of quality control
+        independent_review = inputs.get('independent_review')
+        if independent_review is None:
+            # Reuse the manuscript parsed by the analysis step, parsing it only when run standalone
+            manuscript_text = get_manuscript(inputs).text
+            independent_review = self.generate_independent_review(manuscript_text, context)
         
         # Step 2: Synthesize balanced executive summary and extract title
         summary_response = self.generate_balanced_summary(independent_review, quality_control_results, context)
@@ -1,11 +1,10 @@
 import json
 import os
 from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
 import openai
-import PyPDF2
-import requests
-from io import BytesIO
 from ...core.base_agent import BaseReviewerAgent
+from ...utils.manuscript import get_manuscript
 
 class QualityControlAgent(BaseReviewerAgent):
     """
@@ -63,31 +62,6 @@ class QualityControlAgent(BaseReviewerAgent):
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def extract_pdf_text(self, pdf_source: str) -> str:
-        """Extract text from a PDF file or URL."""
-        text = ""
-    
-        if pdf_source.startswith("http://") or pdf_source.startswith("https://"):
-            # Source is a URL
-            response = requests.get(pdf_source)
-            response.raise_for_status()  # Raises error if the download failed
-            pdf_file = BytesIO(response.content)
-        else:
-            # Source is a local file path
-            pdf_file = open(pdf_source, 'rb')
-        
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page in pdf_reader.pages:
-                extracted_text = page.extract_text()
-                if extracted_text:
-                    text += extracted_text + "\n"
-        finally:
-            if not isinstance(pdf_file, BytesIO):
-                pdf_file.close()
-        
-        return text
-
     def process(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main processing method that:
@@ -98,54 +72,57 @@ class QualityControlAgent(BaseReviewerAgent):
         
         # Load all input data
         context = inputs['context']
-        rigor_results = inputs['rigor_results']
-        section_results = inputs['section_results']
-        writing_results = inputs['writing_results']
                 
-        # Extract manuscript text
-        manuscript_text = self.extract_pdf_text(inputs['manuscript_src'])       
+        # Reuse the manuscript parsed by the analysis step, parsing it only when run standalone
+        manuscript_text = get_manuscript(inputs).text
         
-        # Process each category separately
-        final_results = {}
-        
-        # Process section results        
-        print("Processing section results...")
-        section_prompt = self.generate_category_prompt(
-            'section_results',
-            section_results,
-            manuscript_text,
-            context
-        )
-        section_analysis = json.loads(self.llm(section_prompt))
-        final_results['section_results'] = section_analysis.get('section_results', {})
-        
-        # Process rigor results
-        print("Processing rigor results...")
-        rigor_prompt = self.generate_category_prompt(
-            'rigor_results',
-            rigor_results,
-            manuscript_text,
-            context
-        )
-        rigor_analysis = json.loads(self.llm(rigor_prompt))
-        final_results['rigor_results'] = rigor_analysis.get('rigor_results', {})
-        
-        # Process writing results
-        print("Processing writing results...")
-        writing_prompt = self.generate_category_prompt(
-            'writing_results',
-            writing_results,
-            manuscript_text,
-            context
-        )
-        writing_analysis = json.loads(self.llm(writing_prompt))
-        final_results['writing_results'] = writing_analysis.get('writing_results', {})
+        # Process each category separately; the categories share no state, so their
+        # calls run concurrently under the shared rate limiter
+        categories = list(self.section_mappings)
+        with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+            analyses = executor.map(
+                lambda category: self.process_category(category, inputs[category], manuscript_text, context),
+                categories
+            )
+            final_results = dict(zip(categories, analyses))
         
         # Format the output
         formatted_output = self.format_output(final_results)
         
         return formatted_output
 
+    def process_category(self, category: str, results: Dict, manuscript_text: str, context: Dict) -> Dict[str, Any]:
+        """
+        Quality-control the agent results of one category, e.g. 'section_results'.
+        The categories are independent, so they can be processed as soon as their
+        agents finish; format_output assembles them into the final report.
+        A failed call or malformed response is returned as an error for this
+        category only, so the other categories are kept.
+        """
+        print(f"Processing {category.replace('_', ' ')}...")
+        def has_sections(content: str) -> bool:
+            """Check that the response is an object whose category, if present, is an object of sections."""
+            try:
+                analysis = json.loads(content)
+            except ValueError:
+                return False
+            return isinstance(analysis, dict) and isinstance(analysis.get(category, {}), dict)
+        
+        try:
+            prompt = self.generate_category_prompt(category, results, manuscript_text, context)
+            # Responses of the wrong shape are not cached, so a resumed run asks the model again
+            content = self.llm(prompt, validate=has_sections)
+            analysis = json.loads(content)
+            if not has_sections(content):
+                raise ValueError(f"Expected an object of sections for {category}, got {str(content)[:100]}")
+            return analysis.get(category, {})
+        except Exception as e:
+            print(f"Error processing {category.replace('_', ' ')}: {str(e)}")
+            return {
+                'status': 'error',
+                'message': f'Error processing {category}: {str(e)}'
+            }
+
     def generate_category_prompt(self, category: str, results: Dict, manuscript_text: str, context: Dict) -> str:
         """
         Generate a prompt for analyzing a specific category of results.
@@ -246,6 +223,22 @@ Ensure your response is valid JSON and includes all required fields."""
                 if category not in analysis_results:
                     raise ValueError(f"Missing category: {category}")
                 
+                # A category whose quality control failed reports the error in each of its sections,
+                # without a score, so the failure is not averaged like a real score
+                if analysis_results[category].get('status') == 'error':
+                    message = analysis_results[category]['message']
+                    analysis_results[category] = {
+                        code: {
+                            'status': 'error',
+                            'error': True,
+                            'message': message,
+                            'score': None,
+                            'section_name': name
+                        }
+                        for code, name in sections.items()
+                    }
+                    continue
+                
                 for code, name in sections.items():
                     if code not in analysis_results[category]:
                         analysis_results[category][code] = {
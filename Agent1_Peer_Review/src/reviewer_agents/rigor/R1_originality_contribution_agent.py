@@ -10,10 +10,22 @@ class OriginalityContributionAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R1_Originality_Contribution_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['front_matter', 'introduction', 'related_work', 'discussion', 'conclusion']
         
     def analyze_originality_contribution(self, text: str, field_context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyzes the originality and contribution of the research."""
-        prompt = f"""Analyze the following text for originality and contribution to the field. Focus on:
+        prompt = self.build_prompt(field_context)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing originality and contribution: {str(e)}")
+    
+    def build_prompt(self, field_context: Dict[str, Any]) -> str:
+        """Builds the rubric for analyzing the originality and contribution of the research."""
+        return f"""Analyze the above text for originality and contribution to the field. Focus on:
         1. Novelty of the research approach
         2. Unique contributions to the field
         3. Verification of stated novelty claims
@@ -29,7 +41,6 @@ class OriginalityContributionAgent(BaseReviewerAgent):
         - Discussion: Impact assessment, future implications
         - Conclusion: Contribution summary, field advancement
 
-        Text to analyze: {text}
         Field context: {json.dumps(field_context, indent=2)}
 
         Provide a detailed analysis in the following JSON format:
@@ -67,13 +78,6 @@ class OriginalityContributionAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the research.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing originality and contribution: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
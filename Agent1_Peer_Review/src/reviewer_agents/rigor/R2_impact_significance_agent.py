@@ -10,10 +10,22 @@ class ImpactSignificanceAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R2_Impact_Significance_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['front_matter', 'introduction', 'discussion', 'conclusion']
         
     def analyze_impact_significance(self, text: str, field_context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyzes the impact and significance of the research."""
-        prompt = f"""Analyze the following text for impact and significance. Focus on:
+        prompt = self.build_prompt(field_context)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing impact and significance: {str(e)}")
+    
+    def build_prompt(self, field_context: Dict[str, Any]) -> str:
+        """Builds the rubric for analyzing the impact and significance of the research."""
+        return f"""Analyze the above text for impact and significance. Focus on:
         1. Potential influence on the field
         2. Broader implications of findings
         3. Influence on future research
@@ -29,7 +41,6 @@ class ImpactSignificanceAgent(BaseReviewerAgent):
         - Discussion: Broader implications, future directions
         - Conclusion: Impact summary, application potential
 
-        Text to analyze: {text}
         Field context: {json.dumps(field_context, indent=2)}
 
         Provide a detailed analysis in the following JSON format:
@@ -73,13 +84,6 @@ class ImpactSignificanceAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the research impact and significance.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing impact and significance: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
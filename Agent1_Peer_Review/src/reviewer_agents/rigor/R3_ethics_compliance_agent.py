@@ -10,10 +10,22 @@ class EthicsComplianceAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R3_Ethics_Compliance_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['methods', 'declarations']
         
     def analyze_ethics_compliance(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes ethical considerations and compliance with research standards."""
-        prompt = f"""Analyze the following text for ethical considerations and research standards compliance. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing ethics and compliance: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing ethical considerations and compliance with research standards."""
+        return f"""Analyze the above text for ethical considerations and research standards compliance. Focus on:
         1. Conflicts of interest
         2. Data privacy and protection
         3. Informed consent procedures
@@ -30,7 +42,6 @@ class EthicsComplianceAgent(BaseReviewerAgent):
         - Discussion: Ethical implications, compliance reflection
         - Conclusion: Ethical summary, compliance assurance
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -74,13 +85,6 @@ class EthicsComplianceAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances ethical compliance and research standards.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing ethics and compliance: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class DataCodeAvailabilityAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R4_Data_Code_Availability_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['methods', 'declarations', 'supplementary']
         
     def analyze_data_code_availability(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes data and code availability."""
-        prompt = f"""Analyze the following text for data and code availability. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing data and code availability: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing data and code availability."""
+        return f"""Analyze the above text for data and code availability. Focus on:
         1. Data sharing practices
         2. Code repository availability
         3. Documentation completeness
@@ -30,7 +42,6 @@ class DataCodeAvailabilityAgent(BaseReviewerAgent):
         - Discussion: Reproducibility considerations
         - Conclusion: Availability summary, access information
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -74,13 +85,6 @@ class DataCodeAvailabilityAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances data and code availability.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing data and code availability: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
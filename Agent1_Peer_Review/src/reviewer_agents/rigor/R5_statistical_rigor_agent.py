@@ -10,10 +10,22 @@ class StatisticalRigorAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R5_Statistical_Rigor_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['methods', 'results', 'supplementary']
         
     def analyze_statistical_rigor(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes statistical methods appropriateness and correctness."""
-        prompt = f"""Analyze the following text for statistical methods appropriateness and correctness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing statistical rigor: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing statistical methods appropriateness and correctness."""
+        return f"""Analyze the above text for statistical methods appropriateness and correctness. Focus on:
         1. Statistical test selection
         2. Assumption verification
         3. Sample size justification
@@ -35,7 +47,6 @@ class StatisticalRigorAgent(BaseReviewerAgent):
         - Discussion: Statistical interpretation
         - Conclusion: Statistical significance summary
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -84,13 +95,6 @@ class StatisticalRigorAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances statistical rigor.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing statistical rigor: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
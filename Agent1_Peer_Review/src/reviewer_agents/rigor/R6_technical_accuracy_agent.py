@@ -10,10 +10,22 @@ class TechnicalAccuracyAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "R6_Technical_Accuracy_Agent"
         self.category = "Scientific Rigor"
+        # Manuscript sections this agent reviews
+        self.sections = ['methods', 'results', 'supplementary']
         
     def analyze_technical_accuracy(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes mathematical derivations, algorithms, and technical content."""
-        prompt = f"""Analyze the following text for technical accuracy. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing technical accuracy: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing mathematical derivations, algorithms, and technical content."""
+        return f"""Analyze the above text for technical accuracy. Focus on:
         1. Mathematical derivation correctness
         2. Algorithm correctness and efficiency
         3. Technical terminology accuracy
@@ -36,7 +48,6 @@ class TechnicalAccuracyAgent(BaseReviewerAgent):
         - Discussion: Technical implications
         - Conclusion: Technical significance summary
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -85,13 +96,6 @@ class TechnicalAccuracyAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances technical accuracy.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing technical accuracy: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -13,7 +13,17 @@ class ConsistencyAgent(BaseReviewerAgent):
         
     def analyze_consistency(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes logical coherence across sections."""
-        prompt = f"""Analyze the following text for logical coherence and consistency across sections. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing consistency: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing logical coherence across sections."""
+        return f"""Analyze the above text for logical coherence and consistency across sections. Focus on:
         1. Alignment between methods and results
         2. Consistency between results and conclusions
         3. Logical flow between sections
@@ -36,7 +46,6 @@ class ConsistencyAgent(BaseReviewerAgent):
         - Figures/Tables: Text alignment
         - Supplementary: Main text consistency
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -79,13 +88,6 @@ class ConsistencyAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances logical coherence and consistency.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing consistency: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
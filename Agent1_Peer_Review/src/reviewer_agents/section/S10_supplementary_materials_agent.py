@@ -10,10 +10,22 @@ class SupplementaryMaterialsAgentS10(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S10_Supplementary_Materials_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['supplementary']
         
     def analyze_supplementary_materials(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the supplementary materials of the manuscript."""
-        prompt = f"""Analyze the following supplementary materials for quality and completeness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing supplementary materials: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the supplementary materials of the manuscript."""
+        return f"""Analyze the above supplementary materials for quality and completeness. Focus on:
         1. Relevance to main text
         2. Clarity of presentation
         3. Consistency with main text
@@ -31,7 +43,6 @@ class SupplementaryMaterialsAgentS10(BaseReviewerAgent):
         - Consistency: Alignment with main text, coherence
         - Completeness: Information detail, methodological thoroughness
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -75,13 +86,6 @@ class SupplementaryMaterialsAgentS10(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the supplementary materials.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing supplementary materials: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
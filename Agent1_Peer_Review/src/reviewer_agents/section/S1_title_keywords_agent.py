@@ -10,10 +10,22 @@ class TitleKeywordsAgentS1(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S1_Title_Keywords_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['front_matter']
         
     def analyze_title_keywords(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the title and keywords of the manuscript."""
-        prompt = f"""Analyze the title and keywords section of the manuscript. Follow these steps:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing title and keywords: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the title and keywords of the manuscript."""
+        return f"""Analyze the title and keywords section of the manuscript. Follow these steps:
 
         1. FIRST, check if there is a dedicated "Keywords:" or "Keywords" section in the text.
            - Look for a line that starts with "Keywords:" or "Keywords"
@@ -40,7 +52,6 @@ class TitleKeywordsAgentS1(BaseReviewerAgent):
            - Do not generate any keyword-related feedback
            - Do not make assumptions about keywords from other text
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -87,13 +98,6 @@ class TitleKeywordsAgentS1(BaseReviewerAgent):
         5. All locations should be either "Title" or "Keywords", never "Abstract"
         6. Focus on improving discoverability and search optimization
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing title and keywords: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class AbstractAgentS2(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S2_Abstract_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['front_matter']
         
     def analyze_abstract(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the abstract of the manuscript."""
-        prompt = f"""Analyze the following abstract for quality and completeness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing abstract: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the abstract of the manuscript."""
+        return f"""Analyze the above abstract for quality and completeness. Focus on:
         1. Structure and organization
         2. Content completeness
         3. Clarity and readability
@@ -32,7 +44,6 @@ class AbstractAgentS2(BaseReviewerAgent):
         - Standards: Scientific writing, field conventions
         - Impact: Significance, implications, contributions
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -70,13 +81,6 @@ class AbstractAgentS2(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the abstract.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing abstract: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class IntroductionAgentS3(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S3_Introduction_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['introduction']
         
     def analyze_introduction(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the introduction of the manuscript."""
-        prompt = f"""Analyze the following introduction for quality and effectiveness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing introduction: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the introduction of the manuscript."""
+        return f"""Analyze the above introduction for quality and effectiveness. Focus on:
         1. Background context
         2. Problem statement
         3. Research gap identification
@@ -32,7 +44,6 @@ class IntroductionAgentS3(BaseReviewerAgent):
         - Significance: Impact, contribution
         - Structure: Organization, flow
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -76,13 +87,6 @@ class IntroductionAgentS3(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the introduction.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing introduction: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class LiteratureReviewAgentS4(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S4_Literature_Review_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['introduction', 'related_work']
         
     def analyze_literature_review(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the literature review of the manuscript."""
-        prompt = f"""Analyze the following literature review for quality and comprehensiveness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing literature review: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the literature review of the manuscript."""
+        return f"""Analyze the above literature review for quality and comprehensiveness. Focus on:
         1. Coverage breadth
         2. Historical context
         3. Current state
@@ -32,7 +44,6 @@ class LiteratureReviewAgentS4(BaseReviewerAgent):
         - Citations: Quality, recency
         - Integration: Connection to research
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -76,13 +87,6 @@ class LiteratureReviewAgentS4(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the literature review.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing literature review: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class MethodologyAgentS5(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S5_Methodology_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['methods']
         
     def analyze_methodology(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the methodology of the manuscript."""
-        prompt = f"""Analyze the following methodology for quality and completeness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing methodology: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the methodology of the manuscript."""
+        return f"""Analyze the above methodology for quality and completeness. Focus on:
         1. Research design
         2. Data collection
         3. Sampling approach
@@ -32,7 +44,6 @@ class MethodologyAgentS5(BaseReviewerAgent):
         - Quality: Validity, reliability, rigor
         - Ethics: Consent, approval, considerations
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -76,13 +87,6 @@ class MethodologyAgentS5(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the methodology.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing methodology: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
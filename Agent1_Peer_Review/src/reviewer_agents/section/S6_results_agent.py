@@ -10,10 +10,22 @@ class ResultsAgentS6(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S6_Results_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['results']
         
     def analyze_results(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the results of the manuscript."""
-        prompt = f"""Analyze the following results for quality and presentation. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing results: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the results of the manuscript."""
+        return f"""Analyze the above results for quality and presentation. Focus on:
         1. Data presentation
         2. Statistical analysis
         3. Figure/table quality
@@ -32,7 +44,6 @@ class ResultsAgentS6(BaseReviewerAgent):
         - Quality: Accuracy, completeness
         - Impact: Significance, effect sizes
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -76,13 +87,6 @@ class ResultsAgentS6(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the results section.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing results: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class ConclusionAgentS8(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S8_Conclusion_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['conclusion']
         
     def analyze_conclusion(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the conclusion of the manuscript."""
-        prompt = f"""Analyze the following conclusion for quality and completeness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing conclusion: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the conclusion of the manuscript."""
+        return f"""Analyze the above conclusion for quality and completeness. Focus on:
         1. Support from results
         2. Research objective fulfillment
         3. Key findings summary
@@ -31,7 +43,6 @@ class ConclusionAgentS8(BaseReviewerAgent):
         - Implications: Practical, theoretical, future directions
         - Presentation: Clarity, conciseness, strength
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -75,13 +86,6 @@ class ConclusionAgentS8(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the conclusion.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing conclusion: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -10,10 +10,22 @@ class ReferencesAgentS9(BaseReviewerAgent):
         super().__init__(model)
         self.name = "S9_References_Agent"
         self.category = "Section Review"
+        # Manuscript sections this agent reviews
+        self.sections = ['references']
         
     def analyze_references(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the references of the manuscript."""
-        prompt = f"""Analyze the reference list (bibliography) provided at the end of the manuscript. Focus exclusively on the reference list, not in-text citations. Assess:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing references: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the references of the manuscript."""
+        return f"""Analyze the reference list (bibliography) provided at the end of the manuscript. Focus exclusively on the reference list, not in-text citations. Assess:
         1. Completeness of reference details (authors, title, journal, year, etc.)
         2. Consistency and correctness of reference formatting
         3. Relevance and recency of sources
@@ -28,7 +40,6 @@ class ReferencesAgentS9(BaseReviewerAgent):
         - Quality: Are the sources relevant, recent, and diverse?
         - Organization: Is the reference list well-organized and correctly ordered?
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -66,13 +77,6 @@ class ReferencesAgentS9(BaseReviewerAgent):
         Focus on 3-5 highest-impact improvements that would significantly enhance the research value.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the reference list.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing references: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class LanguageStyleAgent(BaseReviewerAgent):
     """Agent responsible for reviewing grammar, spelling, and punctuation."""
@@ -10,10 +11,22 @@ class LanguageStyleAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W1_Language_Style_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_language_style(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes grammar, spelling, and punctuation in the text."""
-        prompt = f"""Analyze the following text for grammar, spelling, and punctuation issues. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing language style: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing grammar, spelling, and punctuation in the text."""
+        return f"""Analyze the above text for grammar, spelling, and punctuation issues. Focus on:
         1. Grammar correctness
         2. Spelling accuracy
         3. Punctuation usage
@@ -35,7 +48,6 @@ class LanguageStyleAgent(BaseReviewerAgent):
         - Conclusion: Summary language
         - References: Citation format
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -78,13 +90,6 @@ class LanguageStyleAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the language and style.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing language style: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class NarrativeStructureAgent(BaseReviewerAgent):
     """Agent responsible for evaluating the overall flow, coherence, and logical organization of the paper."""
@@ -10,10 +11,22 @@ class NarrativeStructureAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W2_Narrative_Structure_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_narrative_structure(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the narrative flow and structural organization of the text."""
-        prompt = f"""Analyze the following text for narrative flow and structural organization. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing narrative structure: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the narrative flow and structural organization of the text."""
+        return f"""Analyze the above text for narrative flow and structural organization. Focus on:
         1. Overall narrative coherence
         2. Logical progression of ideas
         3. Section transitions
@@ -35,7 +48,6 @@ class NarrativeStructureAgent(BaseReviewerAgent):
         - Conclusion: Research story closure
         - Figures/Tables: Visual narrative
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -78,13 +90,6 @@ class NarrativeStructureAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances the narrative structure.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing narrative structure: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
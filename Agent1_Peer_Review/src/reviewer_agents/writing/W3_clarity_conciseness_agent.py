@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class ClarityConcisenessAgent(BaseReviewerAgent):
     """Agent responsible for evaluating clarity and conciseness of the manuscript."""
@@ -10,10 +11,22 @@ class ClarityConcisenessAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W3_Clarity_Conciseness_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_clarity_conciseness(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the clarity and conciseness of the text."""
-        prompt = f"""Analyze the following text for clarity and conciseness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing clarity and conciseness: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the clarity and conciseness of the text."""
+        return f"""Analyze the above text for clarity and conciseness. Focus on:
         1. Language simplicity
         2. Jargon usage
         3. Wordiness
@@ -35,7 +48,6 @@ class ClarityConcisenessAgent(BaseReviewerAgent):
         - Conclusion: Message conciseness
         - Technical Content: Jargon explanation
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -84,13 +96,6 @@ class ClarityConcisenessAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances clarity and conciseness.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing clarity and conciseness: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class TerminologyConsistencyAgent(BaseReviewerAgent):
     """Agent responsible for ensuring consistent use of terms, notations, and acronyms."""
@@ -10,10 +11,22 @@ class TerminologyConsistencyAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W4_Terminology_Consistency_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_terminology_consistency(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the consistency of terminology, notations, and acronyms in the text."""
-        prompt = f"""Analyze the following text for terminology consistency. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing terminology consistency: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the consistency of terminology, notations, and acronyms in the text."""
+        return f"""Analyze the above text for terminology consistency. Focus on:
         1. Term usage consistency
         2. Notation consistency
         3. Acronym usage and definition
@@ -35,7 +48,6 @@ class TerminologyConsistencyAgent(BaseReviewerAgent):
         - Conclusion: Term consistency
         - Equations: Notation style
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -84,13 +96,6 @@ class TerminologyConsistencyAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances terminology consistency.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing terminology consistency: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class InclusiveLanguageAgent(BaseReviewerAgent):
     """Agent responsible for evaluating inclusive, unbiased language usage."""
@@ -10,10 +11,22 @@ class InclusiveLanguageAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W5_Inclusive_Language_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_inclusive_language(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the use of inclusive and unbiased language in the text."""
-        prompt = f"""Analyze the following text for inclusive and unbiased language usage. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing inclusive language: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the use of inclusive and unbiased language in the text."""
+        return f"""Analyze the above text for inclusive and unbiased language usage. Focus on:
         1. Gender-neutral language
         2. Cultural sensitivity
         3. Age-appropriate terminology
@@ -35,7 +48,6 @@ class InclusiveLanguageAgent(BaseReviewerAgent):
         - Conclusion: Generalizability statements
         - References: Author representation
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -84,13 +96,6 @@ class InclusiveLanguageAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances inclusivity.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing inclusive language: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -13,7 +13,17 @@ class CitationFormattingAgent(BaseReviewerAgent):
         
     def analyze_citation_formatting(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes the formatting and consistency of citations in the text."""
-        prompt = f"""Analyze the following manuscript text for in-text citation formatting, style, and consistency. Focus exclusively on in-text citations (not the reference list). Assess:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing citation formatting: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing the formatting and consistency of citations in the text."""
+        return f"""Analyze the above manuscript text for in-text citation formatting, style, and consistency. Focus exclusively on in-text citations (not the reference list). Assess:
         1. In-text citation style (e.g., APA, Vancouver, Harvard, etc.)
         2. Consistency of in-text citation formatting throughout the manuscript
         3. Correct placement and ordering of in-text citations
@@ -30,7 +40,6 @@ class CitationFormattingAgent(BaseReviewerAgent):
         - Style consistency: Are delimiters, author lists, and years handled consistently?
         - Cross-reference: Do all in-text citations match the reference list?
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -68,13 +77,6 @@ class CitationFormattingAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different categories, focusing only on in-text citations.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances in-text citation formatting and consistency.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing citation formatting: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
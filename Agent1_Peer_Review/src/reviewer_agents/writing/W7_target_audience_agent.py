@@ -2,6 +2,7 @@ from typing import Dict, Any, List
 import json
 from ...core.base_agent import BaseReviewerAgent
 from ...core.report_template import ReportTemplate
+from ...utils.section_splitter import BODY_SECTIONS
 
 class TargetAudienceAlignmentAgent(BaseReviewerAgent):
     """Agent responsible for evaluating writing style and formatting alignment with target audience."""
@@ -10,10 +11,22 @@ class TargetAudienceAlignmentAgent(BaseReviewerAgent):
         super().__init__(model)
         self.name = "W7_Target_Audience_Alignment_Agent"
         self.category = "Writing and Presentation"
+        # Manuscript sections this agent reviews
+        self.sections = BODY_SECTIONS
         
     def analyze_target_audience_alignment(self, text: str, research_type: str) -> Dict[str, Any]:
         """Analyzes how well the writing style and formatting align with the target audience."""
-        prompt = f"""Analyze the following text for target audience alignment and writing style appropriateness. Focus on:
+        prompt = self.build_prompt(research_type)
+        
+        try:
+            analysis = self.review(prompt, text)
+            return analysis
+        except Exception as e:
+            return self._generate_error_report(f"Error analyzing target audience alignment: {str(e)}")
+    
+    def build_prompt(self, research_type: str) -> str:
+        """Builds the rubric for analyzing how well the writing style and formatting align with the target audience."""
+        return f"""Analyze the above text for target audience alignment and writing style appropriateness. Focus on:
         1. Technical depth and complexity
         2. Field-specific terminology usage
         3. Writing style formality
@@ -35,7 +48,6 @@ class TargetAudienceAlignmentAgent(BaseReviewerAgent):
         - Conclusion: Summary style
         - Visual Elements: Integration and complexity
 
-        Text to analyze: {text}
         Research type: {research_type}
 
         Provide a detailed analysis in the following JSON format:
@@ -84,13 +96,6 @@ class TargetAudienceAlignmentAgent(BaseReviewerAgent):
         Important: Generate at least 5-10 improvement suggestions across different sections and categories.
         Each suggestion should be specific, actionable, and include clear explanations of how it enhances audience alignment.
         """
-        
-        try:
-            response = self.llm(prompt)
-            analysis = json.loads(response)
-            return analysis
-        except Exception as e:
-            return self._generate_error_report(f"Error analyzing target audience alignment: {str(e)}")
     
     def _generate_error_report(self, error_message: str) -> Dict[str, Any]:
         """Generates a structured error report."""
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Stage timing for benchmarking the review pipeline.
+
+Each stage records its wall time, CPU time, peak resident memory and the
+number of language model calls and the time spent waiting for them.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from ..core.usage import usage_tracker
+
+
+def current_rss() -> int:
+    """Return the resident set size of this process in bytes, or 0 if unknown."""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak rather than the current size, in bytes on macOS and KiB elsewhere
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if os.uname().sysname == 'Darwin' else maxrss * 1024
+    except (ImportError, AttributeError):
+        return 0
+
+
+class MemorySampler:
+    """Background thread tracking the peak resident set size between resets."""
+    
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self) -> None:
+        """Start sampling."""
+        self.reset()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def reset(self) -> int:
+        """Restart the peak at the current size and return the previous peak."""
+        rss = current_rss()
+        with self._lock:
+            peak = max(self.peak, rss)
+            self.peak = rss
+        return peak
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            rss = current_rss()
+            with self._lock:
+                self.peak = max(self.peak, rss)
+
+
+class StageRecorder:
+    """Records the cost of consecutive pipeline stages.
+    
+    Usage:
+        recorder = StageRecorder()
+        with recorder.stage('pdf_parsing'):
+            ...
+        report = recorder.report()
+    """
+    
+    def __init__(self):
+        self.stages: List[Dict[str, Any]] = []
+        self.sampler = MemorySampler()
+        self.sampler.start()
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as a stage with the given name."""
+        usage_before = usage_tracker.summary()
+        self.sampler.reset()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            usage_after = usage_tracker.summary()
+            self.stages.append({
+                'stage': name,
+                'wall_seconds': time.perf_counter() - wall_start,
+                'cpu_seconds': time.process_time() - cpu_start,
+                'peak_rss_mb': self.sampler.reset() / (1024 * 1024),
+                'llm_calls': usage_after['calls'] - usage_before['calls'],
+                'llm_wait_seconds': usage_after['wait_seconds'] - usage_before['wait_seconds']
+            })
+    
+    def close(self) -> None:
+        """Stop the memory sampler."""
+        self.sampler.stop()
+    
+    def report(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the recorded stages and their totals.
+        
+        Args:
+            extra (Dict[str, Any], optional): Additional fields for the report
+            
+        Returns:
+            Dict[str, Any]: Stages, totals and the extra fields
+        """
+        report = dict(extra or {})
+        report['stages'] = list(self.stages)
+        report['total'] = {
+            'wall_seconds': sum(stage['wall_seconds'] for stage in self.stages),
+            'cpu_seconds': sum(stage['cpu_seconds'] for stage in self.stages),
+            'peak_rss_mb': max((stage['peak_rss_mb'] for stage in self.stages), default=0.0),
+            'llm_calls': sum(stage['llm_calls'] for stage in self.stages),
+            'llm_wait_seconds': sum(stage['llm_wait_seconds'] for stage in self.stages)
+        }
+        return report
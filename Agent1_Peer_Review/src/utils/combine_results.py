@@ -2,17 +2,32 @@
 """
 Utility functions for combining results from different agents.
 
-Input files:
-- section_results.json: Results from section agents (S1-S10)
-- rigor_results.json: Results from rigor agents (R1-R7)
-- writing_results.json: Results from writing agents (W1-W7)
+Agent results are split in memory into three categories:
+- section_results: Results from section agents (S1-S10)
+- rigor_results: Results from rigor agents (R1-R7)
+- writing_results: Results from writing agents (W1-W7)
+
+Runs are kept in the result store (see result_store); on request, a run is also
+exported as a single bundle file (RUN_BUNDLE_FILE) holding the manuscript data
+and the agent results.
 """
 
 import json
 import os
 import glob
+import tempfile
 from typing import Dict, Any
 
+# File name of the run bundle in the results directory
+RUN_BUNDLE_FILE = 'analysis_bundle.json'
+
+# Category of the agent results by the first letter of the agent ID
+AGENT_CATEGORIES = {
+    'S': 'section_results',
+    'R': 'rigor_results',
+    'W': 'writing_results'
+}
+
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """Load and parse a JSON file."""
@@ -34,50 +49,84 @@ def save_json_file(data: Dict[str, Any], file_path: str) -> None:
         print(f"Error saving JSON file: {e}")
 
 
-def combine_results_by_category(results_dir: str, output_dir: str) -> None:
-    """Combine individual agent results into three category-specific JSON files."""
-    # Initialize category-specific result dictionaries
-    section_results = {}
-    rigor_results = {}
-    writing_results = {}
+def save_json_atomic(data: Any, file_path: str, indent: int = None) -> None:
+    """Save data to a JSON file through a temporary file, so readers never see a partial file."""
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=indent)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def categorize_results(results: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Split agent results keyed by agent ID into section, rigor and writing results.
     
-    # Get all JSON files in the results directory
-    json_files = glob.glob(os.path.join(results_dir, '*_results.json'))
+    Empty results and results reporting an error are left out.
     
-    # Process each JSON file
-    for file_path in json_files:
-        # Extract agent name from filename (e.g., 'S1_results.json' -> 'S1')
-        agent_name = os.path.basename(file_path).split('_')[0]
-        
-        # Skip files that are not agent results
-        if agent_name in ['critical_remarks', 'score', 'detailed_feedback', 'summary', 'improvement_suggestions', 'combined']:
+    Args:
+        results (Dict[str, Any]): Agent results keyed by agent ID (S1..W7)
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: 'section_results', 'rigor_results' and 'writing_results'
+    """
+    categories = {category: {} for category in AGENT_CATEGORIES.values()}
+    for agent_name, agent_results in results.items():
+        category = AGENT_CATEGORIES.get(agent_name[:1])
+        if category is None:
             continue
-        
-        # Load the agent's results
-        agent_results = load_json_file(file_path)
-        
-        # Skip if the file is empty or contains an error
         if not agent_results or (isinstance(agent_results, dict) and 'error' in agent_results):
-            print(f"Skipping {file_path} due to error or empty file")
+            print(f"Skipping {agent_name} results due to error or empty result")
             continue
-        
-        # Categorize and add the agent's results
-        if agent_name.startswith('S'):
-            section_results[agent_name] = agent_results
-        elif agent_name.startswith('R'):
-            rigor_results[agent_name] = agent_results
-        elif agent_name.startswith('W'):
-            writing_results[agent_name] = agent_results
+        categories[category][agent_name] = agent_results
+    return categories
+
+
+def save_run_bundle(manuscript_data: Dict[str, Any], results: Dict[str, Any], output_dir: str,
+                    write_agent_files: bool = False) -> str:
+    """Save the manuscript data and agent results of an analysis run in one atomic write.
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    Args:
+        manuscript_data (Dict[str, Any]): Serialized manuscript (Manuscript.to_dict)
+        results (Dict[str, Any]): Agent results keyed by agent ID
+        output_dir (str): Results directory
+        write_agent_files (bool): Also write one {agent_id}_results.json file per agent
+    
+    Returns:
+        str: Path of the bundle file
+    """
+    bundle_path = os.path.join(output_dir, RUN_BUNDLE_FILE)
+    save_json_atomic({'manuscript_data': manuscript_data, 'agent_results': results}, bundle_path)
+    if write_agent_files:
+        for agent_name, agent_results in results.items():
+            save_json_atomic(agent_results, os.path.join(output_dir, f"{agent_name}_results.json"), indent=2)
+    return bundle_path
+
+
+def combine_results_by_category(results_dir: str, output_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Combine individual agent result files into three category-specific JSON files.
+    
+    Only needed for per-agent files written with write_agent_files; the pipeline
+    categorizes results in memory with categorize_results.
+    """
+    results = {}
+    for file_path in glob.glob(os.path.join(results_dir, '*_results.json')):
+        # Extract agent name from filename (e.g., 'S1_results.json' -> 'S1')
+        agent_name = os.path.basename(file_path).split('_')[0]
+        if agent_name[:1] in AGENT_CATEGORIES and agent_name[1:].isdigit():
+            results[agent_name] = load_json_file(file_path)
+    categories = categorize_results(results)
     
     # Save the categorized results
-    save_json_file(section_results, os.path.join(output_dir, 'section_results.json'))
-    save_json_file(rigor_results, os.path.join(output_dir, 'rigor_results.json'))
-    save_json_file(writing_results, os.path.join(output_dir, 'writing_results.json'))
+    os.makedirs(output_dir, exist_ok=True)
+    for category, category_results in categories.items():
+        save_json_file(category_results, os.path.join(output_dir, f'{category}.json'))
     
-    return {"section_results": section_results, "rigor_results": rigor_results, "writing_results": writing_results}
+    return categories
 
 
 def main():
@@ -0,0 +1,132 @@
+from typing import Dict, Any, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from ..core.config import (DOWNLOAD_CACHE_DIR, DOWNLOAD_MAX_BYTES, DOWNLOAD_CONNECT_TIMEOUT,
+                           DOWNLOAD_READ_TIMEOUT, DOWNLOAD_POOL_SIZE)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def is_url(pdf_source: str) -> bool:
+    """Check whether a manuscript source is a URL rather than a local path."""
+    return pdf_source.startswith("http://") or pdf_source.startswith("https://")
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_path_locks: Dict[str, threading.Lock] = {}
+_path_locks_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide HTTP session with a pooled connection adapter."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=DOWNLOAD_POOL_SIZE, pool_maxsize=DOWNLOAD_POOL_SIZE,
+                                      max_retries=2)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _path_lock(path: str) -> threading.Lock:
+    """Return the lock of a cached download, so one URL is not fetched twice at once."""
+    with _path_locks_lock:
+        if path not in _path_locks:
+            _path_locks[path] = threading.Lock()
+        return _path_locks[path]
+
+
+def _cache_paths(url: str, cache_dir: str) -> Dict[str, str]:
+    """Return the paths of the cached body and validators of a URL."""
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return {
+        "body": os.path.join(cache_dir, f"{name}.pdf"),
+        "meta": os.path.join(cache_dir, f"{name}.json")
+    }
+
+
+def _load_meta(path: str) -> Dict[str, Any]:
+    """Return the stored validators of a cached download, or {} if there are none."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def download_pdf(url: str, cache_dir: str = DOWNLOAD_CACHE_DIR, max_bytes: int = DOWNLOAD_MAX_BYTES,
+                 timeout: tuple = (DOWNLOAD_CONNECT_TIMEOUT, DOWNLOAD_READ_TIMEOUT)) -> str:
+    """Download a PDF to the local download cache and return the path of the file.
+    
+    The body is streamed in chunks to a temporary file, so it is never held in
+    memory, and moved into place once complete. A URL downloaded before is
+    revalidated with its ETag / Last-Modified validators and reused when the
+    server answers 304 Not Modified.
+    
+    Args:
+        url (str): URL of the PDF
+        cache_dir (str): Directory of downloaded files
+        max_bytes (int): Maximum size of the PDF
+        timeout (tuple): Connect and read timeouts in seconds
+    
+    Returns:
+        str: Path of the downloaded PDF
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = _cache_paths(url, cache_dir)
+    
+    with _path_lock(paths["body"]):
+        meta = _load_meta(paths["meta"]) if os.path.exists(paths["body"]) else {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        
+        with get_session().get(url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 304:
+                return paths["body"]
+            response.raise_for_status()
+            
+            length = response.headers.get("Content-Length")
+            if length and length.isdigit() and int(length) > max_bytes:
+                raise Exception(f"PDF at {url} is {int(length)} bytes, more than the limit of {max_bytes} bytes")
+            
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+            try:
+                size = 0
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise Exception(f"PDF at {url} is more than the limit of {max_bytes} bytes")
+                        f.write(chunk)
+                os.replace(tmp_path, paths["body"])
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            
+            validators = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+        with open(paths["meta"], "w") as f:
+            json.dump(validators, f)
+    
+    return paths["body"]
+
+
+def resolve_pdf(pdf_source: str) -> str:
+    """Return a local path for a manuscript source, downloading it if it is a URL."""
+    return download_pdf(pdf_source) if is_url(pdf_source) else pdf_source
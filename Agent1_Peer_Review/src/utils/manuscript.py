@@ -0,0 +1,136 @@
+from typing import Dict, Any, List, Optional
+from .pdf_parser import PDFParser
+from .download import resolve_pdf
+from .parse_cache import get_parse_cache, content_hash
+from .section_segmenter import section_texts
+
+
+class Manuscript:
+    """A manuscript parsed once and shared by analysis, quality control and executive summary.
+    
+    Holds the extracted text (also split per page), the PDF metadata, the detected
+    tables, the figure metadata and the section tree with the character offsets of
+    each section. Raw image bytes are not kept.
+    """
+    
+    def __init__(self, source: str, pages: List[str], metadata: Dict[str, str],
+                 tables: Optional[List[Dict[str, Any]]] = None,
+                 images: Optional[List[Dict[str, Any]]] = None,
+                 sections: Optional[List[Dict[str, Any]]] = None, content_hash: str = ""):
+        """
+        Initialize the manuscript.
+        
+        Args:
+            source (str): Path or URL of the PDF
+            pages (List[str]): Text of each page
+            metadata (Dict[str, str]): PDF metadata
+            tables (List[Dict[str, Any]], optional): Detected tables
+            images (List[Dict[str, Any]], optional): Figure metadata
+            sections (List[Dict[str, Any]], optional): Section tree (see section_segmenter.segment_sections)
+            content_hash (str, optional): SHA-256 of the PDF
+        """
+        self.source = source
+        self.content_hash = content_hash
+        self.pages = pages
+        self.metadata = metadata
+        self.tables = tables or []
+        self.images = images or []
+        self.sections = sections or []
+        self.text = "".join(page + "\n" for page in pages)
+        self._section_texts: Optional[Dict[str, str]] = None
+    
+    @property
+    def page_offsets(self) -> List[int]:
+        """Character offset of the start of each page in the text."""
+        offsets, position = [], 0
+        for page in self.pages:
+            offsets.append(position)
+            position += len(page) + 1
+        return offsets
+    
+    @classmethod
+    def from_pdf(cls, pdf_source: str) -> "Manuscript":
+        """Download (for URLs) and parse a PDF once.
+        
+        Parses are cached by the content of the PDF, so a resubmitted manuscript
+        skips parsing entirely.
+        
+        Args:
+            pdf_source (str): Path or URL of the PDF
+        
+        Returns:
+            Manuscript: The parsed manuscript
+        """
+        pdf_path = resolve_pdf(pdf_source)
+        pdf_hash = content_hash(pdf_path)
+        
+        cache = get_parse_cache()
+        if cache is not None:
+            key = cache.make_key(pdf_hash)
+            cached = cache.get(key)
+            if cached is not None:
+                print(f"Using cached parse of {pdf_source}")
+                return cls(source=pdf_source, content_hash=pdf_hash, **cached)
+        
+        parser = PDFParser(pdf_path)
+        parsed = parser.parse()
+        manuscript = cls(
+            source=pdf_source,
+            pages=parsed['pages'],
+            metadata=parser.get_metadata(),
+            tables=parsed['tables'],
+            images=parsed['images'],
+            sections=parsed['sections'],
+            content_hash=pdf_hash
+        )
+        
+        # A parse missing the text of scanned pages is not cached, so OCR is tried again next time
+        if parser.ocr_failed_pages:
+            print(f"Not caching the parse of {pdf_source}: OCR failed on {len(parser.ocr_failed_pages)} page(s)")
+        elif cache is not None:
+            cache.set(key, manuscript.pages, manuscript.metadata, manuscript.tables, manuscript.images,
+                      manuscript.sections)
+        return manuscript
+    
+    @property
+    def section_texts(self) -> Dict[str, str]:
+        """Text of each canonical section (see section_segmenter.section_texts), sliced once on first use."""
+        if self._section_texts is None:
+            self._section_texts = section_texts(self.text, self.sections)
+        return self._section_texts
+    
+    def get_section(self, name: str) -> str:
+        """Return the text of a canonical section, or '' if the manuscript has none."""
+        return self.section_texts.get(name, '')
+    
+    @property
+    def title(self) -> str:
+        """Title from the PDF metadata, if any."""
+        return self.metadata.get('title') or 'Unknown'
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            'text': self.text,
+            'metadata': self.metadata,
+            'images': self.images,
+            'tables': self.tables,
+            'sections': self.sections,
+            'content_hash': self.content_hash
+        }
+
+
+def get_manuscript(inputs: Dict[str, Any]) -> Manuscript:
+    """Return the parsed manuscript of a pipeline input, parsing the PDF only if needed.
+    
+    Args:
+        inputs (Dict[str, Any]): Pipeline inputs with 'manuscript_src' and optionally
+            an already parsed 'manuscript_data'
+    
+    Returns:
+        Manuscript: The parsed manuscript
+    """
+    manuscript_data = inputs.get('manuscript_data')
+    if isinstance(manuscript_data, Manuscript):
+        return manuscript_data
+    return Manuscript.from_pdf(inputs['manuscript_src'])
@@ -0,0 +1,201 @@
+from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import fitz
+import numpy as np
+import pytesseract
+from ..core.config import (OCR_CACHE_ENABLED, OCR_CACHE_PATH, OCR_CACHE_MAX_BYTES, OCR_DPI, OCR_LANGUAGE,
+                           OCR_MIN_CHARS, OCR_WORKERS)
+
+
+def needs_ocr(page: fitz.Page, text: str, min_chars: int = OCR_MIN_CHARS) -> bool:
+    """Check whether a page has no usable text layer but shows images, i.e. is scanned.
+    
+    Args:
+        page (fitz.Page): The page
+        text (str): Text extracted from the text layer of the page
+        min_chars (int): Minimum number of non-whitespace characters of a usable text layer
+    
+    Returns:
+        bool: True if the page should be read by OCR
+    """
+    return len("".join(text.split())) < min_chars and bool(page.get_images())
+
+
+def page_content_hash(doc: fitz.Document, page_num: int, dpi: int = OCR_DPI,
+                      language: str = OCR_LANGUAGE) -> str:
+    """Hash what a page renders from: its content stream, raw image streams, geometry and the OCR settings.
+    
+    The image streams are hashed without being decoded, so the hash is cheap compared
+    to rendering, and identical scanned pages in different PDFs share OCR results.
+    """
+    page = doc[page_num]
+    digest = hashlib.sha256()
+    digest.update(f"{dpi}:{language}:{tuple(page.rect)}:{page.rotation}".encode("utf-8"))
+    digest.update(page.read_contents())
+    for xref in sorted({image[0] for image in page.get_images(full=True)}):
+        digest.update(doc.xref_stream_raw(xref) or b"")
+    return digest.hexdigest()
+
+
+def _ocr_page(source: Any, page_num: int, dpi: int, language: str) -> str:
+    """Render a page to a grayscale pixmap and read it with tesseract (runs in a worker process).
+    
+    Args:
+        source (Any): Path of the PDF file or its bytes
+        page_num (int): Page index
+        dpi (int): Rendering resolution
+        language (str): Tesseract language code(s)
+    
+    Returns:
+        str: Recognized text of the page
+    """
+    doc = fitz.open(source) if isinstance(source, str) else fitz.open("pdf", source)
+    try:
+        pixmap = doc[page_num].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        pixels = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.stride)
+        return pytesseract.image_to_string(pixels[:, :pixmap.width], lang=language)
+    finally:
+        doc.close()
+
+
+class OCRCache:
+    """Persistent cache of OCR results keyed by page_content_hash.
+    
+    OCR dominates the parsing time of scanned manuscripts, so its results are kept
+    independently of the parse cache and survive parser version changes. The cache
+    is bounded in size and evicts least recently used pages first.
+    """
+    
+    def __init__(self, path: str = OCR_CACHE_PATH, max_bytes: int = OCR_CACHE_MAX_BYTES):
+        """
+        Initialize the OCR cache.
+        
+        Args:
+            path (str): Path of the SQLite database file
+            max_bytes (int): Maximum total size of cached page texts
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_pages (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_pages_accessed ON ocr_pages (accessed_at)")
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text of a page, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM ocr_pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE ocr_pages SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return row[0]
+    
+    def set(self, key: str, text: str) -> None:
+        """Store the text of a page and evict least recently used pages beyond the size cap."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_pages (key, text, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, text, len(text.encode("utf-8")), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Drop the least recently used pages until under the size cap."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        stale_keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM ocr_pages ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM ocr_pages WHERE key = ?", stale_keys)
+
+
+_cache: Optional[OCRCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> Optional[OCRCache]:
+    """Return the process-wide OCR cache, or None if caching is disabled."""
+    global _cache
+    if not OCR_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = OCRCache()
+    return _cache
+
+
+def ocr_pages(doc: fitz.Document, source: Any, page_nums: List[int], workers: int = OCR_WORKERS,
+              dpi: int = OCR_DPI, language: str = OCR_LANGUAGE) -> Dict[int, str]:
+    """Read pages by OCR, using cached results where available.
+    
+    Only the listed pages are rendered. Uncached pages are read in a process pool,
+    one task per page; a single page, or workers=1, is read in this process.
+    
+    Args:
+        doc (fitz.Document): The open document, used for the content hashes
+        source (Any): Path of the PDF file or its bytes, reopened by the workers
+        page_nums (List[int]): Indices of the pages to read
+        workers (int): Maximum number of worker processes
+        dpi (int): Rendering resolution
+        language (str): Tesseract language code(s)
+    
+    Returns:
+        Dict[int, str]: Recognized text by page index; pages that could not be read are left out
+    """
+    cache = get_ocr_cache()
+    keys = {page_num: page_content_hash(doc, page_num, dpi, language) for page_num in page_nums}
+    texts = {}
+    if cache is not None:
+        for page_num, key in keys.items():
+            cached = cache.get(key)
+            if cached is not None:
+                texts[page_num] = cached
+    
+    missing = [page_num for page_num in page_nums if page_num not in texts]
+    if not missing:
+        return texts
+    
+    print(f"Running OCR on {len(missing)} page(s) without a text layer")
+    try:
+        if workers > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+                results = list(executor.map(_ocr_page, repeat(source), missing, repeat(dpi), repeat(language)))
+        else:
+            results = [_ocr_page(source, page_num, dpi, language) for page_num in missing]
+    except Exception as e:
+        print(f"OCR failed, keeping the text layer of {len(missing)} page(s): {str(e)}")
+        return texts
+    
+    for page_num, text in zip(missing, results):
+        texts[page_num] = text
+        if cache is not None:
+            cache.set(keys[page_num], text)
+    return texts
@@ -0,0 +1,197 @@
+from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from ..core.config import (
+    PDF_CACHE_ENABLED, PDF_CACHE_PATH, PDF_CACHE_MAX_BYTES, OCR_ENABLED, OCR_DPI, OCR_LANGUAGE, OCR_MIN_CHARS
+)
+
+# Bump whenever extraction changes, so parses of older parser versions are not reused
+PARSER_VERSION = "7"
+
+
+def content_hash(pdf: Any) -> str:
+    """Return the SHA-256 of a PDF given as bytes or as a local file path."""
+    digest = hashlib.sha256()
+    if isinstance(pdf, (bytes, bytearray)):
+        digest.update(pdf)
+    else:
+        with open(pdf, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Turn a list of records into one list per field."""
+    fields = []
+    for row in rows:
+        fields.extend(field for field in row if field not in fields)
+    return {field: [row.get(field) for row in rows] for field in fields}
+
+
+def _from_columns(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Turn one list per field back into a list of records."""
+    if not columns:
+        return []
+    count = len(next(iter(columns.values())))
+    return [{field: values[i] for field, values in columns.items()} for i in range(count)]
+
+
+def encode_parse(pages: List[str], metadata: Dict[str, str], tables: List[Dict[str, Any]],
+                 images: List[Dict[str, Any]], sections: List[Dict[str, Any]]) -> bytes:
+    """Serialize a parsed manuscript into a compressed columnar blob.
+    
+    The page texts are stored as one string with page offsets; tables, image
+    metadata and sections are stored column by column, which compresses far
+    better than records.
+    
+    Returns:
+        bytes: The zlib-compressed blob
+    """
+    offsets = [0]
+    for page in pages:
+        offsets.append(offsets[-1] + len(page))
+    payload = {
+        "text": "".join(pages),
+        "page_offsets": offsets,
+        "metadata": metadata,
+        "tables": _to_columns(tables),
+        "images": _to_columns(images),
+        "sections": _to_columns(sections)
+    }
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def decode_parse(blob: bytes) -> Dict[str, Any]:
+    """Deserialize a blob written by encode_parse.
+    
+    Returns:
+        Dict[str, Any]: pages, metadata, tables, images and sections
+    """
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+    text, offsets = payload["text"], payload["page_offsets"]
+    return {
+        "pages": [text[start:stop] for start, stop in zip(offsets, offsets[1:])],
+        "metadata": payload["metadata"],
+        "tables": _from_columns(payload["tables"]),
+        "images": _from_columns(payload["images"]),
+        "sections": _from_columns(payload["sections"])
+    }
+
+
+class ParseCache:
+    """Persistent cache of parsed PDFs, keyed by the SHA-256 of the PDF bytes and the parser version.
+    
+    Entries live in a small SQLite database as compressed columnar blobs. The cache
+    is bounded in size and evicts least recently used entries first.
+    """
+    
+    def __init__(self, path: str = PDF_CACHE_PATH, max_bytes: int = PDF_CACHE_MAX_BYTES):
+        """
+        Initialize the parse cache.
+        
+        Args:
+            path (str): Path of the SQLite database file
+            max_bytes (int): Maximum total size of cached parses
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS parses (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_parses_accessed ON parses (accessed_at)")
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(pdf_hash: str) -> str:
+        """Build the cache key of a PDF from its content_hash and the OCR settings that shape its text."""
+        ocr = f"{OCR_DPI}:{OCR_LANGUAGE}:{OCR_MIN_CHARS}" if OCR_ENABLED else "off"
+        return f"{pdf_hash}:{PARSER_VERSION}:ocr={ocr}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse for a key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM parses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE parses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+        return decode_parse(row[0])
+    
+    def set(self, key: str, pages: List[str], metadata: Dict[str, str], tables: List[Dict[str, Any]],
+            images: List[Dict[str, Any]], sections: List[Dict[str, Any]]) -> None:
+        """Store a parse and evict least recently used entries beyond the size cap."""
+        blob = encode_parse(pages, metadata, tables, images, sections)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Drop the least recently used entries until under the size cap."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM parses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        stale_keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM parses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM parses WHERE key = ?", stale_keys)
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size of the cache."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+    
+    def clear(self) -> None:
+        """Remove all cached parses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM parses")
+            self._conn.commit()
+
+
+_cache: Optional[ParseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the process-wide parse cache, or None if caching is disabled."""
+    global _cache
+    if not PDF_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ParseCache()
+    return _cache
@@ -1,35 +1,79 @@
 import os
 import re
 from typing import Dict, Any, List, Tuple
-import PyPDF2
+from itertools import takewhile
 import fitz  # PyMuPDF for better PDF handling
-import pytesseract
-from PIL import Image
-import io
-import numpy as np
-import requests
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from ..core.config import PDF_PARALLEL_MIN_PAGES, PDF_PARSE_WORKERS, OCR_ENABLED
+from .download import is_url, download_pdf
+from .table_detector import detect_tables
+from .spatial_index import SpatialIndex
+from .ocr import needs_ocr, ocr_pages
+from .section_segmenter import MAX_HEADING_WORDS, segment_sections
+
+
+def _walk_page_range(source: Any, start: int, stop: int) -> List[Dict[str, Any]]:
+    """Walk pages [start, stop) in a worker process (see PDFParser.walk_page).
+    
+    Args:
+        source (Any): Path of the PDF file or its bytes
+        start (int): First page index
+        stop (int): Page index after the last page
+    
+    Returns:
+        List[Dict[str, Any]]: Result of each page in the range
+    """
+    parser = PDFParser(source)
+    return [parser.walk_page(page_num) for page_num in range(start, stop)]
+
+
+# Labels starting a figure or table caption, with the caption text after them
+CAPTION_PATTERNS = {
+    element_type: re.compile(rf"\s*{element_type}\s*\d+[.:](.*)", re.IGNORECASE | re.DOTALL)
+    for element_type in ("Figure", "Table")
+}
+
+# Maximum distance in points between a figure or table and its caption
+CAPTION_SEARCH_MARGIN = 20
+
+# Image file formats of the PDF image filters; images stored with other filters are extracted as PNG
+IMAGE_FORMATS = {
+    'DCTDecode': 'jpeg',
+    'JPXDecode': 'jpx',
+    'JBIG2Decode': 'jb2',
+    'CCITTFaxDecode': 'tiff'
+}
+
 
 class PDFParser:
     """Enhanced PDF parser with figure and table detection capabilities."""
     
-    def __init__(self, pdf_source: str):
+    def __init__(self, pdf_source: Any):
         """Initialize the PDF parser.
         
         Args:
-            pdf_path (str): Path to the PDF file
+            pdf_path (str): Path or URL of the PDF file, or its bytes
         """
-        if pdf_source.startswith("http://") or pdf_source.startswith("https://"):
-            # Source is a URL
-            response = requests.get(pdf_source)
-            response.raise_for_status()
-            pdf_file = BytesIO(response.content)
-            self.doc = fitz.open("pdf", pdf_file)  # Open from bytes
+        if isinstance(pdf_source, bytes):
+            # Source is the document itself
+            self.source = pdf_source
+            self.doc = fitz.open("pdf", pdf_source)
+        elif is_url(pdf_source):
+            # Source is a URL, streamed to the download cache and opened from disk
+            self.source = download_pdf(pdf_source)  # Kept so worker processes can reopen the document
+            self.doc = fitz.open(self.source)
         else:
             # Source is a local file path
             if not os.path.exists(pdf_source):
                 raise FileNotFoundError(f"PDF file not found: {pdf_source}")
+            self.source = pdf_source
             self.doc = fitz.open(pdf_source)  # Open from file path
+        
+        # Scanned pages whose OCR failed in the last extraction; they keep their (empty) text layer
+        self.ocr_failed_pages: List[int] = []
+        
+        # Result of parse, shared by extract_images and extract_tables
+        self._parsed = None
     
     def __del__(self):
         """Clean up by closing the document."""
@@ -38,19 +82,196 @@ class PDFParser:
     
     def extract_text(self) -> str:
         """Extract text from the PDF using PyMuPDF for better accuracy."""
-        text = ""
-        try:
-            for page in self.doc:
-                text += page.get_text() + "\n"
-            return text
-        except Exception as e:
-            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+        return "".join(page + "\n" for page in self.extract_pages())
+    
+    def extract_pages(self, workers: int = PDF_PARSE_WORKERS) -> List[str]:
+        """Return the text of each page, as found by parse.
+        
+        Args:
+            workers (int): Maximum number of worker processes
+        
+        Returns:
+            List[str]: Text of each page in document order
+        """
+        return list(self.parse(workers)['pages'])
+    
+    def parse(self, workers: int = PDF_PARSE_WORKERS) -> Dict[str, Any]:
+        """Extract text, tables and image metadata in a single pass over the pages.
+        
+        Long documents are split into contiguous page ranges walked in parallel by
+        worker processes, each opening the document itself. The result is kept, so
+        later calls (e.g. extract_text after extract_tables) do not walk the
+        document again.
+        
+        Args:
+            workers (int): Maximum number of worker processes
+        
+        Returns:
+            Dict[str, Any]: 'pages' (text of each page), 'tables', 'images' (one
+                entry per distinct image, see extract_images) and 'sections' (see
+                section_segmenter.segment_sections)
+        """
+        if self._parsed is None:
+            self._parsed = self._parse(workers)
+        return self._parsed
+    
+    def _parse(self, workers: int) -> Dict[str, Any]:
+        """Walk all pages and assemble their text, tables, images and sections (see parse)."""
+        page_count = self.doc.page_count
+        page_results = None
+        if workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES:
+            try:
+                page_results = self._walk_pages_parallel(min(workers, page_count))
+            except Exception as e:
+                print(f"Parallel PDF parsing failed, falling back to serial parsing: {str(e)}")
+        if page_results is None:
+            try:
+                page_results = [self.walk_page(page_num) for page_num in range(page_count)]
+            except Exception as e:
+                raise Exception(f"Failed to parse PDF: {str(e)}")
+        
+        pages, tables, images = [], [], []
+        seen = {}  # xref -> image entry, so images reused across pages are listed once
+        for page_result in page_results:
+            pages.append(page_result['text'])
+            tables.extend(page_result['tables'])
+            for image in page_result['images']:
+                if image['xref'] in seen:
+                    if image['page'] not in seen[image['xref']]['pages']:
+                        seen[image['xref']]['pages'].append(image['page'])
+                    continue
+                image['pages'] = [image['page']]
+                seen[image['xref']] = image
+                images.append(image)
+        
+        # OCR text of scanned pages has no layout, so their sections are found by wording
+        layout_lines = [page_result['layout_lines'] for page_result in page_results]
+        for page_num, text in self._ocr_scanned_pages(pages).items():
+            pages[page_num] = text
+            layout_lines[page_num] = None
+        sections = segment_sections(pages, layout_lines, [page_result['font_sizes'] for page_result in page_results])
+        return {'pages': pages, 'tables': tables, 'images': images, 'sections': sections}
+    
+    def _ocr_scanned_pages(self, pages: List[str]) -> Dict[int, str]:
+        """Return the OCR text of the scanned pages (see ocr.needs_ocr) by page index."""
+        if not OCR_ENABLED:
+            return {}
+        scanned = [page_num for page_num, text in enumerate(pages) if needs_ocr(self.doc[page_num], text)]
+        if not scanned:
+            return {}
+        texts = ocr_pages(self.doc, self.source, scanned)
+        self.ocr_failed_pages = [page_num for page_num in scanned if page_num not in texts]
+        return texts
+    
+    def _walk_pages_parallel(self, workers: int) -> List[Dict[str, Any]]:
+        """Walk page ranges in a process pool and join them in page order."""
+        page_count = self.doc.page_count
+        step = -(-page_count // workers)  # Ceiling division
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(_walk_page_range, self.source, start, stop) for start, stop in ranges]
+            page_results = []
+            for future in futures:
+                page_results.extend(future.result())
+        return page_results
+    
+    def walk_page(self, page_num: int) -> Dict[str, Any]:
+        """Derive the text, tables and images of a page from one text extraction.
+        
+        The page is read once with get_text("dict"); plain text, tables (see
+        table_detector.detect_tables) and caption lookups all come from that
+        structure. Image positions come from get_image_info, which does not
+        decode the images.
+        
+        Args:
+            page_num (int): Page index
+        
+        Returns:
+            Dict[str, Any]: 'text', 'tables' and 'images' of the page, and the 'layout_lines'
+                and 'font_sizes' used by section_segmenter.segment_sections
+        """
+        page = self.doc[page_num]
+        layout = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+        
+        # Lines (bounding box, text, block number) and spans with their bounding boxes; short
+        # lines with their offset and font are kept for section segmentation
+        lines, spans, block_texts, layout_lines = [], [], [], []
+        font_sizes = {}  # Font size -> number of characters
+        position = 0
+        for block in layout['blocks']:
+            if block['type'] != 0:
+                continue
+            block_lines = []
+            for line in block['lines']:
+                line_text = "".join(span['text'] for span in line['spans'])
+                lines.append((line['bbox'], line_text, block['number']))
+                spans.extend((span['bbox'], span['text']) for span in line['spans'])
+                block_lines.append(line_text)
+                styled_spans = [span for span in line['spans'] if span['text'].strip()]
+                for span in styled_spans:
+                    size = round(span['size'], 1)
+                    font_sizes[size] = font_sizes.get(size, 0) + len(span['text'])
+                if styled_spans and len(line_text.split()) <= MAX_HEADING_WORDS:
+                    size = max(span['size'] for span in styled_spans)
+                    bold = all(span['flags'] & fitz.TEXT_FONT_BOLD for span in styled_spans)
+                    layout_lines.append((position, line_text, size, bold))
+                position += len(line_text) + 1
+            block_texts.append("\n".join(block_lines) + "\n")
+        text = "".join(block_texts)
+        
+        # Spatial index of the lines and the lines starting a caption, for caption lookups
+        index = SpatialIndex([line[0] for line in lines])
+        caption_lines = {
+            element_type: [i for i, line in enumerate(lines) if pattern.match(line[1])]
+            for element_type, pattern in CAPTION_PATTERNS.items()
+        }
+        
+        # Find tables from the alignment of the spans
+        tables = []
+        for table_idx, table in enumerate(detect_tables(spans)):
+            region = fitz.Rect(table['bbox'])
+            tables.append({
+                'page': page_num + 1,
+                'index': table_idx + 1,
+                'bbox': table['bbox'],
+                'rows': table['rows'],
+                'n_rows': table['n_rows'],
+                'n_cols': table['n_cols'],
+                'text': "".join("\t".join(row) + "\n" for row in table['rows']),
+                'caption': self._find_caption_near_rect(lines, index, caption_lines, region, "Table")
+            })
+        
+        images = []
+        for img_idx, info in enumerate(page.get_image_info(xrefs=True)):
+            xref = info['xref']
+            if not xref:  # Inline images cannot be loaded by xref
+                continue
+            rect = fitz.Rect(info['bbox'])
+            images.append({
+                'page': page_num + 1,
+                'index': img_idx + 1,
+                'xref': xref,
+                'bbox': [rect.x0, rect.y0, rect.x1, rect.y1],  # Convert to list for JSON
+                'size': [info['width'], info['height']],
+                'format': self._image_format(xref),
+                'caption': self._find_caption_near_rect(lines, index, caption_lines, rect, "Figure")
+            })
+        
+        return {'text': text, 'tables': tables, 'images': images, 'layout_lines': layout_lines,
+                'font_sizes': font_sizes}
+    
+    def _image_format(self, xref: int) -> str:
+        """Return the file format of an image from its filter, without decoding it."""
+        kind, value = self.doc.xref_get_key(xref, "Filter")
+        if kind == 'array':
+            value = value.strip('[]').split()[-1] if value.strip('[]') else ''
+        return IMAGE_FORMATS.get(value.lstrip('/'), 'png')
     
     def get_metadata(self) -> Dict[str, str]:
         """Extract metadata from the PDF."""
         try:
             metadata = self.doc.metadata
-
+            
             metadata_res = {
                 'title': metadata.get('title', 'Unknown'),
                 'author': metadata.get('author', 'Unknown'),
@@ -62,152 +283,65 @@ class PDFParser:
         except Exception as e:
             raise Exception(f"Failed to extract metadata from PDF: {str(e)}")
     
-    def extract_images(self) -> List[Dict[str, Any]]:
-        """Extract images from the PDF with their locations and captions."""
-        images = []
+    def extract_images(self, include_data: bool = False) -> List[Dict[str, Any]]:
+        """Extract image metadata from the PDF with their locations and captions.
+        
+        Dimensions and format are read from the image dictionaries without decoding
+        the images. An image reused on several pages (e.g. a logo) is listed once,
+        at its first occurrence, with all pages it appears on.
+        
+        Args:
+            include_data (bool): Also load the raw bytes of each image into 'image_data'.
+                Otherwise fetch them on demand with load_image(xref).
+        
+        Returns:
+            List[Dict[str, Any]]: One entry per distinct image
+        """
         try:
-            for page_num, page in enumerate(self.doc):
-                # Extract images
-                image_list = page.get_images()
-                
-                for img_idx, img in enumerate(image_list):
-                    xref = img[0]
-                    base_image = self.doc.extract_image(xref)
-                    
-                    if base_image:
-                        # Convert image data to PIL Image for analysis
-                        image_data = base_image["image"]
-                        image = Image.open(io.BytesIO(image_data))
-                        
-                        # Get image location on page
-                        image_rects = page.get_image_rects(xref)
-                        if not image_rects:  # If no rectangles found, skip this image
-                            continue
-                            
-                        rect = image_rects[0]  # Get first occurrence
-                        
-                        # Try to find caption near the image
-                        caption = self._find_caption_near_rect(page, rect, "Figure")
-                        
-                        images.append({
-                            'page': page_num + 1,
-                            'index': img_idx + 1,
-                            'bbox': [rect.x0, rect.y0, rect.x1, rect.y1],  # Convert to list for JSON
-                            'size': image.size,
-                            'format': base_image["ext"],
-                            'caption': caption,
-                            'image_data': image_data  # Raw image data
-                        })
-            
+            # Copies, so the image data is not added to the kept parse result
+            images = [dict(image) for image in self.parse()['images']]
+            if include_data:
+                for image in images:
+                    image['image_data'] = self.load_image(image['xref'])
             return images
         except Exception as e:
-            # If no images are found, return empty list instead of raising exception
-            if "list index out of range" in str(e):
-                return []
             raise Exception(f"Failed to extract images from PDF: {str(e)}")
     
+    def load_image(self, xref: int) -> bytes:
+        """Load the raw bytes of an image listed by extract_images.
+        
+        Args:
+            xref (int): Cross-reference number of the image
+        
+        Returns:
+            bytes: Image bytes in the format reported by extract_images
+        """
+        base_image = self.doc.extract_image(xref)
+        if not base_image:
+            raise Exception(f"Failed to load image {xref} from PDF")
+        return base_image["image"]
+    
     def extract_tables(self) -> List[Dict[str, Any]]:
-        """Extract tables from the PDF using text analysis."""
-        tables = []
+        """Extract tables with their cells from the alignment of the text spans."""
         try:
-            for page_num, page in enumerate(self.doc):
-                # Find potential table regions using text analysis
-                blocks = page.get_text("blocks")
-                table_regions = self._identify_table_regions(blocks)
-                
-                for region_idx, region in enumerate(table_regions):
-                    # Extract region text
-                    table_text = page.get_text(clip=region)
-                    
-                    # Try to find caption near the table
-                    caption = self._find_caption_near_rect(page, region, "Table")
-                    
-                    tables.append({
-                        'page': page_num + 1,
-                        'index': region_idx + 1,
-                        'bbox': [region.x0, region.y0, region.x1, region.y1],  # Convert to list for JSON
-                        'text': table_text,
-                        'caption': caption
-                    })
-            
-            return tables
+            return self.parse()['tables']
         except Exception as e:
             raise Exception(f"Failed to extract tables from PDF: {str(e)}")
     
-    def _identify_table_regions(self, blocks: List[Any]) -> List[fitz.Rect]:
-        """Identify potential table regions using text block analysis."""
-        table_regions = []
-        current_region = None
-        
-        for block in blocks:
-            text = block[4]
-            rect = fitz.Rect(block[:4])
-            
-            # Heuristics for table detection
-            if (self._looks_like_table_content(text) or
-                self._looks_like_table_header(text)):
-                if current_region is None:
-                    current_region = rect
-                else:
-                    current_region = current_region | rect  # Union of rectangles
-            elif current_region is not None:
-                table_regions.append(current_region)
-                current_region = None
-        
-        if current_region is not None:
-            table_regions.append(current_region)
-        
-        return table_regions
-    
-    def _looks_like_table_content(self, text: str) -> bool:
-        """Check if text block looks like table content."""
-        # Heuristics for table content detection
-        if not text.strip():
-            return False
-        
-        # Check for regular patterns of numbers or short text segments
-        lines = text.split('\n')
-        if len(lines) < 2:
-            return False
-        
-        # Check for consistent delimiters or spacing
-        delimiter_pattern = re.compile(r'[\t|,]|\s{2,}')
-        delimiter_counts = [len(re.findall(delimiter_pattern, line)) for line in lines]
-        
-        # If most lines have the same number of delimiters, likely a table
-        return len(set(delimiter_counts)) <= 2
-    
-    def _looks_like_table_header(self, text: str) -> bool:
-        """Check if text block looks like table header."""
-        # Common table header indicators
-        header_indicators = ['mean', 'std', 'min', 'max', 'total', 'average', 
-                           'value', 'type', 'name', 'id', 'description']
-        
-        text_lower = text.lower()
-        words = text_lower.split()
-        
-        # Check for header-like words
-        return any(indicator in words for indicator in header_indicators)
-    
-    def _find_caption_near_rect(self, page: Any, rect: fitz.Rect, 
+    def _find_caption_near_rect(self, lines: List[Tuple[Any, str, int]], index: SpatialIndex,
+                               caption_lines: Dict[str, List[int]], rect: fitz.Rect,
                                element_type: str) -> str:
-        """Find caption near a given rectangle on the page."""
-        # Create expanded search area
-        margin = 20  # points
-        search_rect = fitz.Rect(
-            rect.x0 - margin,
-            rect.y0 - margin,
-            rect.x1 + margin,
-            rect.y1 + margin
-        )
-        
-        # Get text in the search area
-        nearby_text = page.get_text("text", clip=search_rect)
-        
-        # Look for caption patterns
-        caption_pattern = f"{element_type}\s*\d+[.:](.*?)(?:\n\n|$)"
-        match = re.search(caption_pattern, nearby_text, re.IGNORECASE | re.DOTALL)
-        
-        if match:
-            return match.group(1).strip()
-        return "" 
\ No newline at end of file
+        """Find caption near a given rectangle on the page.
+        
+        The closest line starting with the caption label (e.g. "Table 3:") within
+        CAPTION_SEARCH_MARGIN points of the rectangle starts the caption, which runs
+        to the end of its text block.
+        """
+        item = index.nearest(rect, caption_lines[element_type], CAPTION_SEARCH_MARGIN)
+        if item is None:
+            return ""
+        
+        block = lines[item][2]
+        caption_text = "\n".join(line[1] for line in takewhile(lambda line: line[2] == block, lines[item:]))
+        match = CAPTION_PATTERNS[element_type].match(caption_text)
+        return match.group(1).strip() if match else ""
\ No newline at end of file
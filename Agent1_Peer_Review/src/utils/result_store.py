@@ -0,0 +1,227 @@
+from typing import Dict, Any, List, Optional
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from ..core.config import RESULT_STORE_PATH
+from .manuscript import get_manuscript
+
+
+class ResultStore:
+    """Store of review runs: agent results, quality control, executive summary, timings and usage.
+    
+    Runs are keyed by a run ID and indexed by the content hash of the manuscript.
+    The SQLite database is in WAL mode, so reviews running in parallel processes
+    write their own runs without blocking readers or overwriting each other.
+    """
+    
+    def __init__(self, path: str = RESULT_STORE_PATH):
+        """
+        Initialize the result store.
+        
+        Args:
+            path (str): Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                manuscript_hash TEXT NOT NULL,
+                source TEXT NOT NULL,
+                status TEXT NOT NULL,
+                usage TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_manuscript ON runs (manuscript_hash, created_at);
+            CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at);
+            CREATE TABLE IF NOT EXISTS results (
+                run_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (run_id, kind, name)
+            );
+            CREATE TABLE IF NOT EXISTS timings (
+                run_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                seconds REAL NOT NULL,
+                PRIMARY KEY (run_id, stage)
+            );
+        """)
+        self._conn.commit()
+    
+    @staticmethod
+    def new_run_id() -> str:
+        """Return a new, time-ordered run ID."""
+        return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    
+    def start_run(self, run_id: str, manuscript_hash: str, source: str) -> None:
+        """Register a run; an existing run keeps its results."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, manuscript_hash, source, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'running', ?, ?)",
+                (run_id, manuscript_hash, source, now, now)
+            )
+            self._conn.commit()
+    
+    def finish_run(self, run_id: str, status: str = "completed", usage: Optional[Dict[str, Any]] = None) -> None:
+        """Set the final status and the token usage of a run."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, usage = COALESCE(?, usage), updated_at = ? WHERE run_id = ?",
+                (status, json.dumps(usage) if usage is not None else None, time.time(), run_id)
+            )
+            self._conn.commit()
+    
+    def save_results(self, run_id: str, kind: str, results: Dict[str, Any]) -> None:
+        """Save named results of a run in one transaction, e.g. the agent results keyed by agent ID."""
+        now = time.time()
+        rows = [(run_id, kind, name, json.dumps(value), now) for name, value in results.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (run_id, kind, name, value, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute("UPDATE runs SET updated_at = ? WHERE run_id = ?", (now, run_id))
+            self._conn.commit()
+    
+    def get_results(self, run_id: str, kind: str) -> Dict[str, Any]:
+        """Return the named results of a run of one kind."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, value FROM results WHERE run_id = ? AND kind = ? ORDER BY created_at, rowid",
+                (run_id, kind)
+            ).fetchall()
+        return {name: json.loads(value) for name, value in rows}
+    
+    def save_agent_results(self, run_id: str, results: Dict[str, Any]) -> None:
+        """Save agent results keyed by agent ID."""
+        self.save_results(run_id, "agent", results)
+    
+    def get_agent_results(self, run_id: str) -> Dict[str, Any]:
+        """Return the agent results of a run keyed by agent ID."""
+        return self.get_results(run_id, "agent")
+    
+    def save_result(self, run_id: str, kind: str, result: Any) -> None:
+        """Save the single result of a stage, e.g. 'quality_control' or 'executive_summary'."""
+        self.save_results(run_id, kind, {"": result})
+    
+    def get_result(self, run_id: str, kind: str) -> Optional[Any]:
+        """Return the single result of a stage, or None if it was not saved."""
+        return self.get_results(run_id, kind).get("")
+    
+    def record_timing(self, run_id: str, stage: str, seconds: float) -> None:
+        """Record the wall time of a pipeline stage."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO timings (run_id, stage, seconds) VALUES (?, ?, ?)",
+                (run_id, stage, seconds)
+            )
+            self._conn.commit()
+    
+    @contextmanager
+    def timed(self, run_id: str, stage: str):
+        """Record the wall time of the enclosed block as a pipeline stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(run_id, stage, time.perf_counter() - start)
+    
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return a run with its status, usage and stage timings, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, manuscript_hash, source, status, usage, created_at, updated_at FROM runs "
+                "WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            timings = self._conn.execute(
+                "SELECT stage, seconds FROM timings WHERE run_id = ? ORDER BY rowid", (run_id,)
+            ).fetchall()
+        if row is None:
+            return None
+        return {
+            "run_id": row[0],
+            "manuscript_hash": row[1],
+            "source": row[2],
+            "status": row[3],
+            "usage": json.loads(row[4]) if row[4] else None,
+            "created_at": row[5],
+            "updated_at": row[6],
+            "timings": dict(timings)
+        }
+    
+    def find_runs(self, manuscript_hash: Optional[str] = None, limit: int = 20) -> List[str]:
+        """Return the most recent run IDs, optionally of one manuscript, newest first."""
+        with self._lock:
+            if manuscript_hash is None:
+                rows = self._conn.execute(
+                    "SELECT run_id FROM runs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT run_id FROM runs WHERE manuscript_hash = ? ORDER BY created_at DESC LIMIT ?",
+                    (manuscript_hash, limit)
+                ).fetchall()
+        return [row[0] for row in rows]
+    
+    def latest_run_id(self) -> Optional[str]:
+        """Return the ID of the most recent run, or None if there is none."""
+        runs = self.find_runs(limit=1)
+        return runs[0] if runs else None
+
+
+def is_failed_result(result: Any) -> bool:
+    """Check whether a saved result is missing or reports an error, so its step must run again."""
+    if not result:
+        return True
+    return isinstance(result, dict) and ('error' in result or result.get('status') == 'error')
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """Return the process-wide result store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ResultStore()
+    return _store
+
+
+def get_run_id(inputs: Dict[str, Any]) -> str:
+    """Return the run ID of pipeline inputs, starting a new run if they have none.
+    
+    Args:
+        inputs (Dict[str, Any]): Pipeline inputs; 'run_id' (and 'manuscript_data' if
+            the manuscript had to be parsed) are set on them
+    
+    Returns:
+        str: The run ID
+    """
+    if not inputs.get('run_id'):
+        manuscript = get_manuscript(inputs)
+        inputs['manuscript_data'] = manuscript
+        run_id = ResultStore.new_run_id()
+        get_result_store().start_run(run_id, manuscript.content_hash, manuscript.source)
+        inputs['run_id'] = run_id
+    return inputs['run_id']
@@ -0,0 +1,196 @@
+"""
+Layout-driven segmentation of a manuscript into a tree of sections.
+
+Heading lines are recognised from their typography in PyMuPDF's dict output
+(a font larger than the body text, or bold) and their numbering ("2", "3.1",
+"IV."), with the wording patterns of section_splitter as a fallback for pages
+without layout information such as OCR text. Every section records its page
+and its character offsets in the manuscript text, so the text of any section
+is a slice of the text instead of a new scan.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .section_splitter import SECTION_NAMES, classify_heading
+
+# Numbered heading: "2", "2.", "3.1", "IV." followed by a capitalised title
+NUMBERED_HEADING = re.compile(r'^\s*(?P<number>\d{1,2}(?:\.\d{1,2}){0,3}|[IVX]{1,4})\.?\s+(?P<title>[A-Z].{0,100})$')
+
+# Figure and table captions are often bold but are never headings
+CAPTION_LINE = re.compile(r'^\s*(?:fig(?:ure)?\.?|table)\s*\d+', re.IGNORECASE)
+
+# Longest heading in words; longer lines are prose even when bold
+MAX_HEADING_WORDS = 12
+
+# Minimum ratio of a heading font size to the body font size
+HEADING_SIZE_RATIO = 1.1
+
+# Line of a page with layout information: offset in the page text, text, font size, bold
+LayoutLine = Tuple[int, str, float, bool]
+
+
+def body_font_size(font_sizes: Sequence[Dict[float, int]]) -> float:
+    """Return the font size of most characters of the document.
+    
+    Args:
+        font_sizes (Sequence[Dict[float, int]]): Number of characters per font size, per page
+    
+    Returns:
+        float: The body font size, or 0.0 for a document without text layer
+    """
+    totals: Dict[float, int] = {}
+    for page_sizes in font_sizes:
+        for size, chars in page_sizes.items():
+            totals[size] = totals.get(size, 0) + chars
+    return max(totals, key=totals.get) if totals else 0.0
+
+
+def _candidate(title: str, offset: int, page_num: int, size: Optional[float]) -> Dict[str, Any]:
+    """Build a heading candidate from its title line."""
+    numbered = NUMBERED_HEADING.match(title)
+    return {
+        'title': title,
+        'number': numbered.group('number') if numbered else None,
+        'name': classify_heading(title),
+        'page': page_num + 1,
+        'start': offset,
+        'size': size
+    }
+
+
+def find_headings(pages: List[str], layout_lines: List[Optional[List[LayoutLine]]],
+                  font_sizes: Sequence[Dict[float, int]]) -> List[Dict[str, Any]]:
+    """Find the heading lines of a document in reading order.
+    
+    A line with layout information is a heading if it is short, capitalised or
+    numbered, not a caption, not a sentence, and either set in a heading font
+    (larger than the body text, or bold) or a numbered canonical heading such as
+    "3 Methods". Pages without layout information use the wording patterns of
+    section_splitter.classify_heading.
+    
+    Args:
+        pages (List[str]): Text of each page
+        layout_lines (List[Optional[List[LayoutLine]]]): Short lines of each page, None for pages without layout
+        font_sizes (Sequence[Dict[float, int]]): Number of characters per font size, per page
+    
+    Returns:
+        List[Dict[str, Any]]: Headings with 'title', 'number', 'name' (canonical section
+            name or None), 'page', 'start' (offset in the manuscript text) and 'size'
+    """
+    body_size = body_font_size(font_sizes)
+    headings = []
+    page_offset = 0
+    for page_num, (page_text, lines) in enumerate(zip(pages, layout_lines)):
+        if lines is None:
+            position = 0
+            for line in page_text.split('\n'):
+                if classify_heading(line):
+                    headings.append(_candidate(line.strip(), page_offset + position, page_num, None))
+                position += len(line) + 1
+        else:
+            for offset, text, size, bold in lines:
+                title = text.strip()
+                words = title.split()
+                if not words or len(words) > MAX_HEADING_WORDS or CAPTION_LINE.match(title):
+                    continue
+                candidate = _candidate(title, page_offset + offset, page_num, size)
+                styled = bold or (body_size > 0 and size >= body_size * HEADING_SIZE_RATIO)
+                if not styled and not (candidate['number'] and candidate['name']):
+                    continue
+                if not (title[0].isupper() or candidate['number']) or (title.endswith('.') and not candidate['name']):
+                    continue
+                headings.append(candidate)
+        page_offset += len(page_text) + 1
+    return headings
+
+
+def _assign_levels(headings: List[Dict[str, Any]]) -> None:
+    """Set the nesting level of each heading.
+    
+    Arabic numbering gives the level directly ("3.1" is level 2) and roman numbering
+    is level 1. Unnumbered headings set at least as large as the typical top-level
+    heading are level 1; smaller heading fonts are ranked below it.
+    """
+    top_sizes = [round(h['size'], 1) for h in headings
+                 if h['size'] and (h['name'] or (h['number'] and '.' not in h['number']))]
+    sizes = [round(h['size'], 1) for h in headings if h['size']]
+    top_size = max(set(top_sizes), key=top_sizes.count) if top_sizes else max(sizes, default=0.0)
+    lower_sizes = sorted({size for size in sizes if size < top_size - 0.5}, reverse=True)
+    
+    for heading in headings:
+        number = heading['number']
+        if number and number[0].isdigit():
+            heading['level'] = number.count('.') + 1
+        elif number or not heading['size'] or round(heading['size'], 1) >= top_size - 0.5:
+            heading['level'] = 1
+        else:
+            heading['level'] = 2 + lower_sizes.index(round(heading['size'], 1))
+
+
+def segment_sections(pages: List[str], layout_lines: List[Optional[List[LayoutLine]]],
+                     font_sizes: Sequence[Dict[float, int]]) -> List[Dict[str, Any]]:
+    """Segment a document into a tree of sections.
+    
+    Args:
+        pages (List[str]): Text of each page
+        layout_lines (List[Optional[List[LayoutLine]]]): Short lines of each page, None for pages without layout
+        font_sizes (Sequence[Dict[float, int]]): Number of characters per font size, per page
+    
+    Returns:
+        List[Dict[str, Any]]: Sections in document order with 'title', 'number', 'name',
+            'level', 'page', 'start' and 'end' (character offsets in the manuscript
+            text, the heading included) and 'parent' (index of the enclosing section, -1
+            for top-level sections)
+    """
+    text_length = sum(len(page) + 1 for page in pages)
+    headings = find_headings(pages, layout_lines, font_sizes)
+    _assign_levels(headings)
+    
+    sections: List[Dict[str, Any]] = []
+    open_sections: List[int] = []
+    for heading in headings:
+        # A heading closes every open section at its level or deeper
+        while open_sections and sections[open_sections[-1]]['level'] >= heading['level']:
+            sections[open_sections.pop()]['end'] = heading['start']
+        sections.append({
+            'title': heading['title'],
+            'number': heading['number'],
+            'name': heading['name'],
+            'level': heading['level'],
+            'page': heading['page'],
+            'start': heading['start'],
+            'end': text_length,
+            'parent': open_sections[-1] if open_sections else -1
+        })
+        open_sections.append(len(sections) - 1)
+    return sections
+
+
+def section_texts(text: str, sections: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Return the text of each canonical section, like section_splitter.split_sections.
+    
+    A canonical section runs from its heading to the next canonical heading, so
+    unnamed subsections stay with their section; text before the first canonical
+    heading is front matter.
+    
+    Args:
+        text (str): Full manuscript text
+        sections (List[Dict[str, Any]]): Output of segment_sections
+    
+    Returns:
+        Dict[str, str]: Text per canonical section name; empty if no canonical heading was found
+    """
+    named = [section for section in sections if section['name']]
+    if not named:
+        return {}
+    
+    parts: Dict[str, List[str]] = {'front_matter': [text[:named[0]['start']]]}
+    for section, following in zip(named, named[1:] + [None]):
+        end = following['start'] if following else len(text)
+        parts.setdefault(section['name'], []).append(text[section['start']:end].strip())
+    
+    return {
+        name: '\n'.join(parts[name]).strip()
+        for name in SECTION_NAMES
+        if name in parts and '\n'.join(parts[name]).strip()
+    }
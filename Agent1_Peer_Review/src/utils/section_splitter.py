@@ -0,0 +1,114 @@
+"""
+Utility functions for splitting manuscript text into its main sections.
+
+Headings are recognised from their wording (e.g. "2. Materials and Methods",
+"RESULTS", "Data Availability"). Everything before the first recognised
+heading is treated as front matter (title, authors, abstract, keywords).
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Canonical section names in document order
+SECTION_NAMES = [
+    'front_matter',
+    'introduction',
+    'related_work',
+    'methods',
+    'results',
+    'discussion',
+    'conclusion',
+    'declarations',
+    'references',
+    'supplementary'
+]
+
+# Section body of the manuscript, without references and supplementary material
+BODY_SECTIONS = ['front_matter', 'introduction', 'related_work', 'methods', 'results', 'discussion', 'conclusion']
+
+SECTION_PATTERNS = {
+    'introduction': r'introduction',
+    'related_work': r'related work|background|literature review|prior work|state of the art',
+    'methods': r'(materials and |experimental )?methods?|methodology|materials|study design|experimental (setup|design|procedures?)',
+    'results': r'results?( and discussion)?|findings|experiments|evaluation',
+    'discussion': r'discussion|limitations',
+    'conclusion': r'conclusions?( and future work)?|concluding remarks|summary and conclusions?',
+    'declarations': (r'acknowledge?ments?|funding|data (and code )?availability( statement)?|code availability'
+                     r'|ethics( statement| approval| declarations?)?|competing interests?|conflicts? of interests?'
+                     r'|author contributions?|declarations?'),
+    'references': r'references|bibliography|works cited|literature cited',
+    'supplementary': r'supplementary( materials?| information| data)?|appendix( [a-z0-9]+)?|appendices|supporting information'
+}
+
+# A heading line: optional top-level numbering ("2", "2.", "II."), a short title, optional colon
+HEADING_LINE = re.compile(r'^\s*(?:(?:\d+|[IVX]+)\.?\s+)?(?P<title>[A-Za-z][A-Za-z &\-]{2,60}?)\s*:?\s*$')
+
+COMPILED_PATTERNS = {
+    name: re.compile(rf'(?:{pattern})', re.IGNORECASE) for name, pattern in SECTION_PATTERNS.items()
+}
+
+
+def classify_heading(line: str) -> Optional[str]:
+    """Return the canonical section name if the line is a section heading."""
+    match = HEADING_LINE.match(line)
+    if not match:
+        return None
+    title = match.group('title').strip()
+    # Headings are capitalised; this skips wrapped prose lines such as "evaluation"
+    if not title[0].isupper():
+        return None
+    for name, pattern in COMPILED_PATTERNS.items():
+        if pattern.fullmatch(title):
+            return name
+    return None
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split manuscript text into canonical sections.
+    
+    Args:
+        text (str): Full manuscript text
+        
+    Returns:
+        Dict[str, str]: Text per canonical section name; sections that were not
+        found are omitted. Returns an empty dict if no section headings are found.
+    """
+    parts: Dict[str, List[str]] = {}
+    current = 'front_matter'
+    headings_found = 0
+    
+    for line in text.splitlines():
+        section = classify_heading(line)
+        if section is not None:
+            current = section
+            headings_found += 1
+        parts.setdefault(current, []).append(line)
+    
+    if headings_found == 0:
+        return {}
+    
+    return {
+        name: '\n'.join(parts[name]).strip()
+        for name in SECTION_NAMES
+        if name in parts and '\n'.join(parts[name]).strip()
+    }
+
+
+def select_sections(sections: Dict[str, str], names: Optional[List[str]], full_text: str) -> str:
+    """Return the text of the requested sections.
+    
+    Args:
+        sections (Dict[str, str]): Output of split_sections
+        names (Optional[List[str]]): Requested section names, or None for the full text
+        full_text (str): Full manuscript text used as a fallback
+        
+    Returns:
+        str: The requested sections in document order, or the full text if
+        none of them could be found
+    """
+    if names is None or not sections:
+        return full_text
+    selected = [sections[name] for name in SECTION_NAMES if name in names and name in sections]
+    if not selected:
+        return full_text
+    return '\n\n'.join(selected)
@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+
+
+class SpatialIndex:
+    """Uniform grid over the bounding boxes of a page's text lines.
+    
+    Built once per page; answers "which lines are near this rectangle" and
+    "which of these lines is closest to this rectangle" by visiting only the
+    grid cells the query touches instead of every line of the page.
+    """
+    
+    def __init__(self, boxes: Sequence[Sequence[float]], cell_size: float = 32.0):
+        """
+        Initialize the index.
+        
+        Args:
+            boxes (Sequence[Sequence[float]]): (x0, y0, x1, y1) of each item
+            cell_size (float): Edge length of a grid cell in points
+        """
+        self.boxes = [tuple(box) for box in boxes]
+        self.cell_size = cell_size
+        self.grid: Dict[Tuple[int, int], List[int]] = {}
+        for item, box in enumerate(self.boxes):
+            for cell in self._cells(box):
+                self.grid.setdefault(cell, []).append(item)
+    
+    def _cells(self, box: Sequence[float]) -> List[Tuple[int, int]]:
+        """Return the grid cells overlapped by a box."""
+        x0, y0, x1, y1 = (math.floor(v / self.cell_size) for v in box)
+        return [(gx, gy) for gx in range(x0, x1 + 1) for gy in range(y0, y1 + 1)]
+    
+    def query(self, rect: Sequence[float], margin: float = 0.0) -> List[int]:
+        """Return the items intersecting a rectangle grown by a margin, in insertion order.
+        
+        Args:
+            rect (Sequence[float]): (x0, y0, x1, y1) of the query
+            margin (float): Distance in points added on every side
+        
+        Returns:
+            List[int]: Indices of the matching items
+        """
+        x0, y0, x1, y1 = rect[0] - margin, rect[1] - margin, rect[2] + margin, rect[3] + margin
+        found = set()
+        for cell in self._cells((x0, y0, x1, y1)):
+            for item in self.grid.get(cell, ()):
+                bx0, by0, bx1, by1 = self.boxes[item]
+                if bx0 <= x1 and bx1 >= x0 and by0 <= y1 and by1 >= y0:
+                    found.add(item)
+        return sorted(found)
+    
+    def nearest(self, rect: Sequence[float], items: Sequence[int], max_distance: float) -> Optional[int]:
+        """Return the item of a subset closest to a rectangle, if within max_distance.
+        
+        Args:
+            rect (Sequence[float]): (x0, y0, x1, y1) of the query
+            items (Sequence[int]): Candidate items, e.g. the caption lines of a page
+            max_distance (float): Maximum gap in points between the rectangle and the item
+        
+        Returns:
+            Optional[int]: Index of the closest candidate, or None
+        """
+        candidates = set(items)
+        if not candidates:
+            return None
+        best, best_distance = None, max_distance
+        for item in self.query(rect, max_distance):
+            if item not in candidates:
+                continue
+            distance = self.distance(rect, self.boxes[item])
+            if distance <= best_distance and (best is None or distance < best_distance):
+                best, best_distance = item, distance
+        return best
+    
+    @staticmethod
+    def distance(a: Sequence[float], b: Sequence[float]) -> float:
+        """Return the gap between two rectangles (0 if they overlap)."""
+        dx = max(b[0] - a[2], a[0] - b[2], 0.0)
+        dy = max(b[1] - a[3], a[1] - b[3], 0.0)
+        return math.hypot(dx, dy)
@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import time
+
+
+class StageScheduler:
+    """Runs pipeline stages as a dependency graph.
+
+    Every stage starts as soon as all the stages it depends on have finished, so
+    independent branches of the pipeline overlap instead of running one after the
+    other. A stage is a function of the results of the stages finished so far.
+    When a stage fails, the stages depending on it are not started, the running
+    stages are allowed to finish and the first error is raised.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers (int, optional): Maximum number of stages running at once
+                (default: all stages)
+        """
+        self.max_workers = max_workers
+        self.stages: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], Tuple[str, ...]]] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}
+
+    def add(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Iterable[str] = ()) -> None:
+        """Add a stage.
+
+        Args:
+            name (str): Name of the stage, also the key of its result
+            func (Callable[[Dict[str, Any]], Any]): Function of the results of finished stages
+            depends_on (Iterable[str]): Names of the stages that must finish first
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = (func, tuple(depends_on))
+
+    def run(self) -> Dict[str, Any]:
+        """Run all stages.
+
+        Returns:
+            Dict[str, Any]: Result of each stage by name; start and end of each stage,
+                in seconds since the start of the run, are in self.timings
+        """
+        for name, (_, depends_on) in self.stages.items():
+            unknown = [dependency for dependency in depends_on if dependency not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {name} depends on unknown stages: {', '.join(unknown)}")
+
+        results: Dict[str, Any] = {}
+        pending = list(self.stages)
+        running = {}
+        error = None
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(self.stages) or 1) as executor:
+            while True:
+                # Start every stage whose dependencies are done, in the order stages were added
+                if error is None:
+                    ready = [name for name in pending if all(d in results for d in self.stages[name][1])]
+                    for name in ready:
+                        pending.remove(name)
+                        running[executor.submit(self._run_stage, name, dict(results), start)] = name
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        print(f"Stage {name} failed: {str(e)}")
+                        error = error or e
+
+        if error is not None:
+            raise error
+        if pending:
+            raise ValueError(f"Stages with cyclic dependencies: {', '.join(pending)}")
+        return results
+
+    def _run_stage(self, name: str, results: Dict[str, Any], start: float) -> Any:
+        """Run one stage and record when it started and ended."""
+        stage_start = time.perf_counter() - start
+        try:
+            return self.stages[name][0](results)
+        finally:
+            self.timings[name] = (stage_start, time.perf_counter() - start)
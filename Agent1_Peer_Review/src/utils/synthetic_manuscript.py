@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Generator of synthetic manuscript PDFs for benchmarking the review pipeline.
+
+The manuscripts have the usual section structure, body text, figures with
+captions and tables with captions, and are fully determined by the page
+count and seed.
+"""
+
+import random
+from typing import List
+
+import fitz  # PyMuPDF
+import numpy as np
+
+# Section headings in document order with their share of the body pages
+SECTIONS = [
+    ("1 Introduction", 0.12),
+    ("2 Related Work", 0.10),
+    ("3 Methods", 0.20),
+    ("4 Results", 0.25),
+    ("5 Discussion", 0.13),
+    ("6 Conclusion", 0.05),
+    ("Data Availability", 0.02),
+    ("References", 0.08),
+    ("Appendix A", 0.05)
+]
+
+VOCABULARY = (
+    "model data analysis results method study sample effect significant approach performance "
+    "baseline experiment training evaluation dataset cohort outcome variable measure estimate "
+    "proposed network regression accuracy robust hypothesis framework participants treatment "
+    "distribution parameter statistical error observed compared increase decrease within between"
+).split()
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792  # US letter in points
+MARGIN = 72
+LINE_HEIGHT = 13
+FONT_SIZE = 10
+
+
+def _sentence(rng: random.Random) -> str:
+    """Return a random sentence built from the vocabulary."""
+    words = [rng.choice(VOCABULARY) for _ in range(rng.randint(8, 20))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    """Return a random paragraph."""
+    return " ".join(_sentence(rng) for _ in range(rng.randint(3, 6)))
+
+
+def _figure_pixmap(rng: random.Random, width: int = 320, height: int = 200) -> fitz.Pixmap:
+    """Return a synthetic plot-like RGB image."""
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)[:, None]
+    phase = rng.random() * 6.28
+    red = (np.sin(10 * x + phase) * 0.5 + 0.5) * 255 * np.ones_like(y)
+    green = y * 255 * np.ones_like(x)
+    blue = np.full((height, width), rng.randint(0, 255))
+    pixels = np.stack([red, green, blue], axis=2).astype(np.uint8)
+    return fitz.Pixmap(fitz.csRGB, width, height, pixels.tobytes(), False)
+
+
+def _write_lines(page: fitz.Page, lines: List[str], y: float, font: str = "helv",
+                 size: float = FONT_SIZE) -> float:
+    """Write lines of text starting at height y and return the next free height."""
+    for line in lines:
+        page.insert_text((MARGIN, y), line, fontname=font, fontsize=size)
+        y += LINE_HEIGHT * size / FONT_SIZE
+    return y
+
+
+def _wrap(text: str, width: int = 95) -> List[str]:
+    """Wrap text into lines of at most width characters."""
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + len(word) + 1 > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}".strip()
+    if current:
+        lines.append(current)
+    return lines
+
+
+def generate_manuscript_pdf(output_path: str, pages: int, seed: int = 0,
+                            figure_every: int = 3, table_every: int = 4) -> str:
+    """Generate a synthetic manuscript PDF.
+    
+    Args:
+        output_path (str): Path of the PDF to write
+        pages (int): Number of pages
+        seed (int): Random seed
+        figure_every (int): Put a figure on every n-th page
+        table_every (int): Put a table on every n-th page
+        
+    Returns:
+        str: Path of the written PDF
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+    doc.set_metadata({"title": f"A Synthetic Study of {pages}-Page Manuscripts", "author": "Benchmark Generator"})
+    
+    # Pages on which each section starts (the first page holds title and abstract)
+    body_pages = max(pages - 1, 1)
+    starts, position = {}, 1.0
+    for heading, share in SECTIONS:
+        starts.setdefault(min(int(position), pages - 1), []).append(heading)
+        position += share * body_pages
+    
+    # A logo reused on every page, as journals templates often do
+    logo = _figure_pixmap(random.Random(-1), 60, 20)
+    figure_count = table_count = 0
+    
+    for page_number in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.insert_image(fitz.Rect(PAGE_WIDTH - MARGIN - 60, 30, PAGE_WIDTH - MARGIN, 50), pixmap=logo)
+        y = MARGIN
+        
+        if page_number == 0:
+            y = _write_lines(page, [doc.metadata["title"]], y, font="hebo", size=16) + 10
+            y = _write_lines(page, ["Abstract"], y, font="hebo")
+            y = _write_lines(page, _wrap(_paragraph(rng)), y)
+            y = _write_lines(page, ["Keywords: synthetic data, benchmarking, peer review"], y) + 10
+        
+        # Each section opens with body text, sharing the page with the sections starting after it
+        headings = starts.get(page_number, [])
+        for index, heading in enumerate(headings):
+            y = _write_lines(page, [heading], y + 6, font="hebo", size=12)
+            free_lines = int((PAGE_HEIGHT - MARGIN - y) // LINE_HEIGHT) - 2 * (len(headings) - index - 1)
+            share = max(free_lines // (len(headings) - index), 1)
+            y = _write_lines(page, _wrap(_paragraph(rng))[:share], y) + 6
+        
+        if page_number % figure_every == figure_every - 1 and y < PAGE_HEIGHT - 320:
+            figure_count += 1
+            rect = fitz.Rect(MARGIN, y + 6, MARGIN + 320, y + 206)
+            page.insert_image(rect, pixmap=_figure_pixmap(rng))
+            y = _write_lines(page, [f"Figure {figure_count}: {_sentence(rng)}"], rect.y1 + 16)
+        
+        if page_number % table_every == table_every - 1 and y < PAGE_HEIGHT - 220:
+            table_count += 1
+            y = _write_lines(page, [f"Table {table_count}: {_sentence(rng)}"], y + 10)
+            header = ["Model", "Mean", "Std", "Min", "Max"]
+            for row_index in range(8):
+                cells = header if row_index == 0 else [rng.choice(VOCABULARY)] + [
+                    f"{rng.uniform(0, 100):.2f}" for _ in range(4)
+                ]
+                for column, cell in enumerate(cells):
+                    page.insert_text((MARGIN + column * 90, y), cell, fontname="helv", fontsize=FONT_SIZE)
+                y += LINE_HEIGHT
+            y += 10
+        
+        while y < PAGE_HEIGHT - MARGIN - 5 * LINE_HEIGHT:
+            lines = _wrap(_paragraph(rng))
+            lines = lines[:int((PAGE_HEIGHT - MARGIN - y) // LINE_HEIGHT)]
+            y = _write_lines(page, lines, y) + 6
+    
+    doc.save(output_path, garbage=3, deflate=True)
+    doc.close()
+    return output_path
+
+
+def main():
+    """Main function to run the script."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate a synthetic manuscript PDF')
+    parser.add_argument('output', type=str, help='Path of the PDF to write')
+    parser.add_argument('--pages', '-p', type=int, default=10, help='Number of pages')
+    parser.add_argument('--seed', '-s', type=int, default=0, help='Random seed')
+    
+    args = parser.parse_args()
+    
+    generate_manuscript_pdf(args.output, args.pages, args.seed)
+
+
+if __name__ == "__main__":
+    main()
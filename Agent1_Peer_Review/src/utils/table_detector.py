@@ -0,0 +1,141 @@
+from typing import Dict, Any, List, Sequence, Tuple
+import re
+import numpy as np
+
+# Runs of spaces inside a span that separate table cells typeset as one string
+CELL_SEPARATOR = re.compile(r'\s{2,}|\t')
+
+# Cells with at least this many words are lines of running text. Two columns of them are a
+# two-column page layout, whose gutter looks like a cell gap, rather than a table.
+PROSE_CELL_WORDS = 6
+
+
+def _split_span(bbox: Sequence[float], text: str) -> List[Tuple[Tuple[float, float, float, float], str]]:
+    """Split a span at wide whitespace, estimating the x-extent of each part from its character offsets."""
+    parts = [(m.start(), m.end()) for m in re.finditer(r'\S+(?: \S+)*', text)]
+    if len(parts) <= 1 or not CELL_SEPARATOR.search(text):
+        stripped = text.strip()
+        return [(tuple(bbox), stripped)] if stripped else []
+    x0, y0, x1, y1 = bbox
+    char_width = (x1 - x0) / max(len(text), 1)
+    return [((x0 + start * char_width, y0, x0 + end * char_width, y1), text[start:end]) for start, end in parts]
+
+
+def detect_tables(spans: Sequence[Tuple[Sequence[float], str]], min_rows: int = 2, min_cols: int = 2,
+                  col_gap: float = 8.0) -> List[Dict[str, Any]]:
+    """Detect tables on a page from the bounding boxes of its text spans.
+    
+    Spans are grouped into rows by their vertical centres and into cells by wide
+    horizontal gaps. Consecutive rows with at least min_cols cells form a table
+    candidate, whose columns are the overlapping x-ranges of its cells, so left-,
+    right- and centre-aligned columns are all recognised. Prose has one cell per
+    line, and two-column prose, whose cells are long lines of running text, is
+    rejected, so neither is reported as a table.
+    
+    Args:
+        spans (Sequence[Tuple[Sequence[float], str]]): (x0, y0, x1, y1) and text of each span
+        min_rows (int): Minimum number of rows of a table
+        min_cols (int): Minimum number of columns of a table
+        col_gap (float): Minimum horizontal gap in points between two cells
+    
+    Returns:
+        List[Dict[str, Any]]: Tables in reading order with 'bbox', 'rows' (cell texts
+            row by row, '' for empty cells), 'n_rows' and 'n_cols'
+    """
+    pieces = [piece for bbox, text in spans for piece in _split_span(bbox, text)]
+    if len(pieces) < min_rows * min_cols:
+        return []
+    boxes = np.array([bbox for bbox, _ in pieces], dtype=float)
+    texts = np.array([text for _, text in pieces], dtype=object)
+    
+    # Rows: spans whose vertical centres are within half a line height of each other
+    heights = boxes[:, 3] - boxes[:, 1]
+    line_height = max(float(np.median(heights)), 1.0)
+    centres = (boxes[:, 1] + boxes[:, 3]) / 2
+    by_centre = np.argsort(centres, kind='stable')
+    row_of = np.empty(len(pieces), dtype=int)
+    row_of[by_centre] = np.concatenate([[0], np.cumsum(np.diff(centres[by_centre]) > line_height / 2)])
+    
+    # Cells: within a row, spans separated by more than col_gap start a new cell. Rows are
+    # shifted apart on the x-axis so the running maximum never carries over between rows.
+    order = np.lexsort((boxes[:, 0], row_of))
+    rows = row_of[order]
+    shift = rows * (boxes[:, 2].max() + 2 * col_gap + 1)
+    x0, x1 = boxes[order, 0] + shift, boxes[order, 2] + shift
+    new_cell = np.concatenate([[True], x0[1:] - np.maximum.accumulate(x1)[:-1] > col_gap])
+    cell_start = np.flatnonzero(new_cell)
+    
+    cell_row = rows[cell_start]
+    cell_x0 = np.minimum.reduceat(boxes[order, 0], cell_start)
+    cell_x1 = np.maximum.reduceat(boxes[order, 2], cell_start)
+    cell_y0 = np.minimum.reduceat(boxes[order, 1], cell_start)
+    cell_y1 = np.maximum.reduceat(boxes[order, 3], cell_start)
+    cell_text = [" ".join(cell) for cell in np.split(texts[order], cell_start[1:])]
+    
+    # Rows with several cells, in top-to-bottom order (cells are sorted by row)
+    row_start = np.flatnonzero(np.concatenate([[True], cell_row[1:] != cell_row[:-1]]))
+    row_ids = cell_row[row_start]
+    cells_per_row = np.diff(np.append(row_start, len(cell_row)))
+    row_top = np.minimum.reduceat(cell_y0, row_start)
+    row_bottom = np.maximum.reduceat(cell_y1, row_start)
+    candidate = cells_per_row >= min_cols
+    
+    # Runs of consecutive candidate rows without a large vertical gap
+    tables = []
+    run = []
+    for i, row in enumerate(row_ids):
+        contiguous = run and row_top[i] - row_bottom[run[-1]] <= 1.5 * line_height
+        if candidate[i] and (not run or contiguous):
+            run.append(i)
+            continue
+        if run:
+            tables.extend(_build_table(run, row_ids, cell_row, cell_x0, cell_x1, cell_y0, cell_y1, cell_text,
+                                       min_rows, min_cols, col_gap))
+        run = [i] if candidate[i] else []
+    if run:
+        tables.extend(_build_table(run, row_ids, cell_row, cell_x0, cell_x1, cell_y0, cell_y1, cell_text,
+                                   min_rows, min_cols, col_gap))
+    return tables
+
+
+def _build_table(run: List[int], row_ids: np.ndarray, cell_row: np.ndarray, cell_x0: np.ndarray,
+                 cell_x1: np.ndarray, cell_y0: np.ndarray, cell_y1: np.ndarray, cell_text: List[str],
+                 min_rows: int, min_cols: int, col_gap: float) -> List[Dict[str, Any]]:
+    """Build the cell grid of a run of rows, or return [] if the rows do not share columns."""
+    if len(run) < min_rows:
+        return []
+    in_table = np.isin(cell_row, row_ids[run])
+    cells = np.flatnonzero(in_table)
+    
+    # Columns: overlapping x-ranges of the cells of all rows
+    by_x = cells[np.argsort(cell_x0[cells], kind='stable')]
+    reach = np.maximum.accumulate(cell_x1[by_x])
+    new_column = np.concatenate([[True], cell_x0[by_x][1:] > reach[:-1] + col_gap / 2])
+    column_of = np.empty(len(cell_x0), dtype=int)
+    column_of[by_x] = np.cumsum(new_column) - 1
+    n_cols = int(column_of[by_x[-1]] + 1)
+    
+    # Aligned rows share columns; ragged text spreads over many narrow columns
+    widest_row = int(np.bincount(cell_row[cells]).max())
+    if n_cols < min_cols or n_cols > 1.5 * widest_row:
+        return []
+    
+    # Two columns of mostly long cells are prose set in two columns; tables with long cells
+    # need at least three aligned columns
+    prose_cells = sum(len(cell_text[cell].split()) >= PROSE_CELL_WORDS for cell in cells)
+    if n_cols <= 2 and prose_cells > len(cells) / 2:
+        return []
+    
+    row_index = {row_ids[i]: r for r, i in enumerate(run)}
+    grid = [[''] * n_cols for _ in run]
+    for cell in cells:
+        r, c = row_index[cell_row[cell]], column_of[cell]
+        grid[r][c] = f"{grid[r][c]} {cell_text[cell]}".strip()
+    
+    return [{
+        'bbox': [float(cell_x0[cells].min()), float(cell_y0[cells].min()),
+                 float(cell_x1[cells].max()), float(cell_y1[cells].max())],
+        'rows': grid,
+        'n_rows': len(run),
+        'n_cols': n_cols
+    }]
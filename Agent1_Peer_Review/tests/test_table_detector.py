@@ -0,0 +1,43 @@
+import os
+import sys
+
+import fitz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.table_detector import detect_tables
+
+PROSE = ("the model of reading and the results of the experiment show that readers prefer simple layouts "
+         "over dense ones and that this effect grows with the length of the document under study ")
+
+
+def page_spans(page):
+    """Return the (bbox, text) of each text span of a page."""
+    layout = page.get_text("dict")
+    return [
+        (span['bbox'], span['text'])
+        for block in layout['blocks'] for line in block.get('lines', []) for span in line['spans']
+    ]
+
+
+def test_two_column_prose_is_not_a_table():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(50, 72, 295, 760), PROSE * 12, fontsize=10, align=fitz.TEXT_ALIGN_JUSTIFY)
+    page.insert_textbox(fitz.Rect(315, 72, 560, 760), PROSE * 12, fontsize=10, align=fitz.TEXT_ALIGN_JUSTIFY)
+
+    assert detect_tables(page_spans(page)) == []
+
+
+def test_aligned_table_is_detected():
+    doc = fitz.open()
+    page = doc.new_page()
+    rows = [["Model", "Accuracy", "F1"], ["Baseline", "0.81", "0.78"], ["Ours", "0.89", "0.86"]]
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            page.insert_text((72 + 120 * c, 100 + 16 * r), cell, fontsize=10)
+
+    tables = detect_tables(page_spans(page))
+
+    assert len(tables) == 1
+    assert tables[0]['rows'] == rows
@@ -15,6 +15,14 @@ class Config:
 
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     MODEL_NAME = os.getenv("AGENT2_MODEL_NAME", "gpt-5-nano")
+    # "openai", "openai_compatible" (server at LLM_BASE_URL) or "mock" (offline)
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")
+    LLM_BASE_URL = os.getenv("LLM_BASE_URL")
+    LLM_MOCK_LATENCY_MEAN = float(os.getenv("LLM_MOCK_LATENCY_MEAN", "1.0"))
+    LLM_MOCK_LATENCY_STDDEV = float(os.getenv("LLM_MOCK_LATENCY_STDDEV", "0.0"))
+    # "constant", "uniform", "normal" or "lognormal", as in Agent1_Peer_Review
+    LLM_MOCK_LATENCY_DISTRIBUTION = os.getenv("LLM_MOCK_LATENCY_DISTRIBUTION", "constant")
+    LLM_MOCK_SEED = int(os.getenv("LLM_MOCK_SEED", "0"))
 
     @classmethod
     def require_api_key(cls) -> str:
@@ -1,16 +1,15 @@
 import json
 from typing import Any, Dict
 
-from openai import OpenAI
-
 from .config import Config
+from .llm_backend import create_backend
 
 
 class RiskHeuristicAgent:
     """Desk-rejection heuristics designed to integrate with other agents."""
 
     def __init__(self) -> None:
-        self.client = OpenAI(api_key=Config.require_api_key())
+        self.backend = create_backend()
         self.model_name = Config.MODEL_NAME
 
     def analyze(self, manuscript_text: str, journal_profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -41,9 +40,4 @@ class RiskHeuristicAgent:
         }}
         """
 
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-        )
-        return json.loads(response.choices[0].message.content)
+        return self.backend.complete_json(self.model_name, [{"role": "user", "content": prompt}])
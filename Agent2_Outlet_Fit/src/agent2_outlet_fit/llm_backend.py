@@ -0,0 +1,96 @@
+import json
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from openai import OpenAI
+
+from .config import Config
+
+
+class LLMBackend:
+    """Minimal chat-completion interface used by the outlet-fit agents."""
+
+    def complete_json(self, model: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Run a chat completion in JSON mode and return the parsed object."""
+        raise NotImplementedError
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI API, or any OpenAI-compatible server when a base URL is given."""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None) -> None:
+        self.client = OpenAI(api_key=api_key, base_url=base_url)
+
+    def complete_json(self, model: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            response_format={"type": "json_object"},
+        )
+        return json.loads(response.choices[0].message.content)
+
+
+class MockBackend(LLMBackend):
+    """Offline backend returning a schema-valid desk review after a synthetic latency.
+
+    Latencies follow the same LLM_MOCK_* settings and distributions as the
+    Agent1_Peer_Review mock backend.
+    """
+
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+    def __init__(self, latency_mean: float = 1.0, latency_stddev: float = 0.0,
+                 distribution: str = "constant", seed: int = 0) -> None:
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown mock latency distribution: {distribution}")
+        self.latency_mean = latency_mean
+        self.latency_stddev = latency_stddev
+        self.distribution = distribution
+        self._random = random.Random(seed)
+
+    def sample_latency(self) -> float:
+        """Draw the latency of the next call in seconds."""
+        mean, stddev = self.latency_mean, self.latency_stddev
+        if self.distribution == "constant" or stddev <= 0 or mean <= 0:
+            latency = mean
+        elif self.distribution == "uniform":
+            # Uniform distribution with the given mean and standard deviation
+            half_width = stddev * 3 ** 0.5
+            latency = self._random.uniform(mean - half_width, mean + half_width)
+        elif self.distribution == "normal":
+            latency = self._random.gauss(mean, stddev)
+        else:
+            # Log-normal distribution parameterised by its mean and standard deviation
+            sigma2 = math.log(1 + (stddev / mean) ** 2)
+            mu = math.log(mean) - sigma2 / 2
+            latency = self._random.lognormvariate(mu, sigma2 ** 0.5)
+        return max(0.0, latency)
+
+    def complete_json(self, model: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        time.sleep(self.sample_latency())
+        return {
+            "decision": "REVIEW",
+            "confidence": 0.5,
+            "fatal_violations": [],
+            "rationale": "Mock desk review generated offline.",
+        }
+
+
+def create_backend() -> LLMBackend:
+    """Create the backend selected by the LLM_BACKEND setting."""
+    if Config.LLM_BACKEND == "openai":
+        return OpenAIBackend(Config.require_api_key())
+    if Config.LLM_BACKEND == "openai_compatible":
+        if not Config.LLM_BASE_URL:
+            raise ValueError("LLM_BASE_URL is not set. Add it to your .env file.")
+        return OpenAIBackend(Config.OPENAI_API_KEY or "not-needed", base_url=Config.LLM_BASE_URL)
+    if Config.LLM_BACKEND == "mock":
+        return MockBackend(
+            Config.LLM_MOCK_LATENCY_MEAN,
+            Config.LLM_MOCK_LATENCY_STDDEV,
+            Config.LLM_MOCK_LATENCY_DISTRIBUTION,
+            Config.LLM_MOCK_SEED,
+        )
+    raise ValueError(f"Unknown LLM_BACKEND: {Config.LLM_BACKEND}")